@@ -0,0 +1,219 @@
+"""
+Cold-start timings of the app under the offscreen Qt platform.
+
+Each run starts a fresh interpreter with QT_QPA_PLATFORM=offscreen and a
+fixed screen size for one size category, then runs main.create_app, the
+same startup a real launch uses, timing each of its steps (QApplication,
+watchdog, init_styles, icon warm-up, view imports, MainWindow
+construction) and the first paint of the auth screen. It then enters the user's PIN and times
+PIN accept to the first paint of the POS view, and to the end of the
+POS view's idle-time widget builds.
+
+All timings are in milliseconds. "interpreter_start" and the
+"_from_launch" step are measured from the moment the parent launched the
+child process.
+
+Usage:
+    python -m benchmarks.cold_start [--runs 5] [--output cold_start.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Fixed fake screen per size category (see ScreenConfig._set_size_config)
+SCREEN_SIZES = {
+    'SMALL': (800, 600),
+    'MEDIUM': (1366, 768),
+    'LARGE': (1920, 1080),
+}
+
+# Marks the child's result line among the app's own prints
+RESULT_PREFIX = 'COLD_START_RESULT '
+
+# Give up waiting for a paint after this long
+PAINT_TIMEOUT_S = 10.0
+
+
+def _elapsed_ms(start):
+    return (time.perf_counter() - start) * 1000
+
+
+def _wait_for(condition, timeout=PAINT_TIMEOUT_S):
+    """Process events until condition() is true; False on timeout"""
+    from PyQt5.QtWidgets import QApplication
+
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        QApplication.processEvents()
+        time.sleep(0.0005)
+    return True
+
+
+def run_child(size_category, launched_at):
+    """Run one cold start in this process and print its timings"""
+    process_start = time.perf_counter()
+    timings = {'interpreter_start': (time.time() - launched_at) * 1000}
+
+    start = time.perf_counter()
+    from PyQt5.QtCore import QObject, QEvent
+    from PyQt5.QtWidgets import QApplication
+    import main
+    timings['import'] = _elapsed_ms(start)
+
+    # main.create_app reports each startup step as it finishes
+    marks = [('start', time.perf_counter())]
+    app, window = main.create_app(
+        sys.argv[:1], screen_size=SCREEN_SIZES[size_category],
+        on_step=lambda name: marks.append((name, time.perf_counter()))
+    )
+    for (_, previous), (name, finished) in zip(marks, marks[1:]):
+        timings[name] = (finished - previous) * 1000
+    from views.view_manager import ViewManager
+
+    class PaintWatcher(QObject):
+        """Records the first paint of any widget inside a root widget"""
+
+        def __init__(self):
+            super().__init__()
+            self.root = None
+            self.painted_at = None
+
+        def watch(self, root):
+            self.root = root
+            self.painted_at = None
+
+        def eventFilter(self, obj, event):
+            if (event.type() == QEvent.Paint and self.painted_at is None
+                    and self.root is not None
+                    and (obj is self.root or self.root.isAncestorOf(obj))):
+                self.painted_at = time.perf_counter()
+            return False
+
+    watcher = PaintWatcher()
+    app.installEventFilter(watcher)
+
+    # Auth first paint is measured from the start of MainWindow construction
+    start = dict(marks)['import_views']
+    watcher.watch(window)
+    window.showFullScreen()
+    painted = _wait_for(lambda: watcher.painted_at is not None)
+    timings['auth_first_paint'] = (watcher.painted_at - start) * 1000 if painted else None
+    timings['auth_first_paint_from_launch'] = (
+        timings['interpreter_start'] + (watcher.painted_at - process_start) * 1000
+        if painted else None
+    )
+
+    # Enter the user's PIN the way the keypad does, then accept it
+    auth_container = window.auth_container
+    auth_container.switch_to_pin_view(auth_container.valid_user_id)
+    pin_view = auth_container.pin_view
+    for digit in pin_view.valid_pin:
+        pin_view.pin_input.add_digit(digit)
+    QApplication.processEvents()
+
+    start = time.perf_counter()
+    pin_view._handle_sign_in()
+    timings['pos_view_construction'] = _elapsed_ms(start)
+
+    pos_view = ViewManager.get_instance().pos_views[auth_container.valid_user_id]
+    watcher.watch(pos_view)
+    painted = _wait_for(lambda: watcher.painted_at is not None)
+    timings['pos_first_paint'] = (watcher.painted_at - start) * 1000 if painted else None
+
+    idle_done = _wait_for(lambda: not pos_view._deferred_builds)
+    timings['pos_idle_builds_done'] = _elapsed_ms(start) if idle_done else None
+
+    print(RESULT_PREFIX + json.dumps(timings), flush=True)
+    window.close()
+    app.quit()
+
+
+def run_once(size_category):
+    """Start one child process and return its timings"""
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.cold_start',
+         '--child', size_category, '--launched-at', repr(time.time())],
+        cwd=project_root, env=env, capture_output=True, text=True, check=False
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(
+        f"{size_category} run produced no result (exit code {completed.returncode}):\n"
+        f"{completed.stderr.strip()}"
+    )
+
+
+def _git_revision():
+    """Short commit hash of the measured tree, if available"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(runs):
+    """Median of each timing across runs, ignoring missing values"""
+    summary = {}
+    for key in runs[0]:
+        values = [run[key] for run in runs if run.get(key) is not None]
+        summary[key] = round(statistics.median(values), 3) if values else None
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--sizes', nargs='+', choices=list(SCREEN_SIZES),
+                        default=list(SCREEN_SIZES))
+    parser.add_argument('--output', default='cold_start.json')
+    parser.add_argument('--child', choices=list(SCREEN_SIZES), help=argparse.SUPPRESS)
+    parser.add_argument('--launched-at', type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.launched_at)
+        return
+
+    results = {}
+    for size_category in args.sizes:
+        runs = [run_once(size_category) for _ in range(args.runs)]
+        results[size_category] = {
+            'screen': list(SCREEN_SIZES[size_category]),
+            'median': summarize(runs),
+            'runs': runs,
+        }
+        median = results[size_category]['median']
+        print(f"{size_category:<7} auth first paint {median['auth_first_paint_from_launch']} ms "
+              f"from launch, POS first paint {median['pos_first_paint']} ms after PIN")
+
+    from PyQt5.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'qt': QT_VERSION_STR,
+        'pyqt': PYQT_VERSION_STR,
+        'platform': platform.platform(),
+        'runs_per_size': args.runs,
+        'results': results,
+    }
+    with open(args.output, 'w') as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Per-keystroke product search latency: linear scan vs. n-gram index.
+
+Builds a synthetic catalog in an in-memory SQLite database, then replays
+typing each query one character at a time and times every keystroke.
+Short prefixes match a large share of the catalog, so the full result
+list dominates their cost; the "top N" row shows the latency when only
+one screen of results is requested. The "incremental" rows go through
+ProductService's full result path, which narrows the previous keystroke's
+result set. The "page" rows are the paths the UI uses: one page of ranked
+results, and one page of a category's results for the product grid.
+
+Usage:
+    python -m benchmarks.search_benchmark [--products 50000]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from services.catalog_database import CatalogDatabase
+from services.product_service import ProductService
+
+WORDS = [
+    "Chicken", "Club", "Tuna", "Veggie", "Egg", "Steak", "Cheese", "Vegan",
+    "Sandwich", "Wrap", "Salad", "Chips", "Popcorn", "Nuts", "Coffee", "Tea",
+    "Soda", "Diet", "Lemonade", "Water", "Cookie", "Brownie", "Muffin", "Fruit",
+    "Halloumi", "Labneh", "Zaatar", "Falafel", "Shawarma", "Fries", "Juice",
+]
+
+QUERIES = ["chicken", "tuna wrap", "halloumi", "diet", "zzz", "muffin 12"]
+
+# Roughly one screen of product buttons
+TOP_N = 50
+
+
+def build_catalog(product_count, category_count=20, seed=42):
+    """Create a synthetic catalog with product_count products"""
+    rng = random.Random(seed)
+    categories = [f"Category {i}" for i in range(category_count)]
+    products_by_category = {category: [] for category in categories}
+    prices = {}
+
+    for i in range(product_count):
+        name = f"{' '.join(rng.sample(WORDS, 3))} {i}"
+        products_by_category[categories[i % category_count]].append(name)
+        prices[name] = rng.randint(100, 2000) / 100
+    return categories, products_by_category, prices
+
+
+def linear_scan(categories, products_by_category, search_text):
+    """The original ProductService.filter_products algorithm"""
+    search_text = search_text.lower()
+    filtered_products = []
+    for category in categories:
+        for product in products_by_category.get(category, []):
+            if search_text in product.lower():
+                filtered_products.append(product)
+    return filtered_products
+
+
+def time_keystrokes(search):
+    """Time search() for every prefix of every query, in milliseconds"""
+    timings = []
+    for query in QUERIES:
+        for length in range(1, len(query) + 1):
+            start = time.perf_counter()
+            search(query[:length])
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    """Print latency statistics for one strategy"""
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<14} mean {statistics.mean(timings):8.3f} ms   "
+          f"p50 {statistics.median(timings):8.3f} ms   "
+          f"p95 {p95:8.3f} ms   max {ordered[-1]:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--products', type=int, default=50000)
+    args = parser.parse_args()
+
+    categories, products_by_category, prices = build_catalog(args.products)
+    service = ProductService(CatalogDatabase(':memory:'))
+    service.import_catalog(categories, products_by_category, prices)
+
+    start = time.perf_counter()
+    index = service.get_search_index()
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(index)} products, index built in {build_ms:.1f} ms")
+
+    # Sanity check: both strategies find the same products
+    for query in QUERIES:
+        assert sorted(service.filter_products(query, limit=None)) == \
+            sorted(linear_scan(categories, products_by_category, query))
+
+    report("linear scan", time_keystrokes(
+        lambda text: linear_scan(categories, products_by_category, text)))
+    report("n-gram index", time_keystrokes(index.search))
+    report(f"index top {TOP_N}", time_keystrokes(
+        lambda text: index.search(text, limit=TOP_N)))
+
+    # ProductService narrows the previous result while a query is extended
+    service.reset_search_stats()
+    report("incremental", time_keystrokes(
+        lambda text: service.filter_products(text, limit=None)))
+    report("incr. category", time_keystrokes(
+        lambda text: service.filter_category_products(categories[0], text)))
+    stats = service.get_search_stats()
+    print(f"incremental reuse: {stats['hits']} hits, {stats['misses']} misses")
+
+    report("ranked page", time_keystrokes(service.filter_products))
+    report("category page", time_keystrokes(
+        lambda text: service.filter_category_product_ids(categories[0], text, limit=TOP_N)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,345 @@
+"""
+UI interaction latency of the POS view, driven through QTest.
+
+Builds a POSView on the offscreen platform over a synthetic in-memory
+catalog, fills the order to 1, 50 and 500 lines, and replays common
+interactions with QTest mouse and key events:
+
+    product_tap        tap a product button (adds a line)
+    category_switch    tap a different category button
+    search_keystroke   type one character and flush the search debounce
+    search_debounced   type one character and wait out the search debounce
+    numpad_quantity    tap a numpad digit, then a product button
+    line_select        tap an order line
+    line_remove        remove the selected order line
+    payment_press      tap the cash USD payment button with an amount entered
+
+Each sample is timed from just before the first input event until
+TotalsWidget shows the order's total and, for the search scenarios, the
+product grid has applied the query. Events are processed while waiting,
+but timers that do not affect these checks are not waited for. Setup and
+undo steps between samples are not timed.
+
+Usage:
+    python -m benchmarks.ui_latency [--iterations 50] [--output ui_latency.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication, QPushButton
+
+ORDER_SIZES = [1, 50, 500]
+
+# Screen used for the layout (MEDIUM size category)
+SCREEN_SIZE = (1366, 768)
+
+CATEGORY_COUNT = 12
+PRODUCTS_PER_CATEGORY = 60
+
+WORDS = [
+    "Chicken", "Club", "Tuna", "Veggie", "Egg", "Steak", "Cheese", "Vegan",
+    "Sandwich", "Wrap", "Salad", "Chips", "Popcorn", "Nuts", "Coffee", "Tea",
+]
+
+SEARCH_TEXT = "chick"
+
+# Give up waiting for the totals to settle after this long
+SETTLE_TIMEOUT_S = 5.0
+
+
+def build_catalog(seed=7):
+    """Synthetic catalog with enough priced products for 500 order lines"""
+    rng = random.Random(seed)
+    categories = [f"Category {i}" for i in range(CATEGORY_COUNT)]
+    products_by_category = {}
+    prices = {}
+    for category_index, category in enumerate(categories):
+        names = []
+        for i in range(PRODUCTS_PER_CATEGORY):
+            name = f"{' '.join(rng.sample(WORDS, 2))} {category_index}-{i}"
+            names.append(name)
+            prices[name] = rng.randint(100, 2000) / 100
+        products_by_category[category] = names
+    return categories, products_by_category, prices
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class LatencyBench:
+    """Drives one POSView and collects per-interaction timings"""
+
+    def __init__(self, iterations):
+        self.iterations = iterations
+        self.unexpected_dialogs = 0
+
+        from config.screen_config import screen_config
+        import styles
+        screen_config.set_screen_dimensions(*SCREEN_SIZE)
+        styles.init_styles(screen_config)
+        QApplication.instance().setStyleSheet(styles.AppStyles.get_application_stylesheet())
+
+        from controllers.pos_controller import POSController
+        from services.catalog_database import CatalogDatabase
+        from services.product_service import ProductService
+        from views.pos.pos_view import POSView
+
+        # Import before the view exists so its grid shows this catalog
+        product_service = ProductService(CatalogDatabase(':memory:'))
+        self.categories, self.products_by_category, prices = build_catalog()
+        product_service.import_catalog(self.categories, self.products_by_category, prices)
+
+        self.controller = POSController(product_service)
+        self.view = POSView('bench', 'bench', controller=self.controller)
+        self.view.resize(*SCREEN_SIZE)
+        self.view.show()
+
+        # Anything modal (e.g. a validation message) would block QTest;
+        # close it and count it instead
+        self.dialog_timer = QTimer()
+        self.dialog_timer.timeout.connect(self._dismiss_modal)
+        self.dialog_timer.start(20)
+
+        # Let the deferred widgets build before measuring
+        self._settle()
+        while self.view._deferred_builds:
+            QApplication.processEvents()
+
+        self.grid = self.view.product_grid
+        self.numpad_buttons = {
+            btn.text(): btn for btn in self.view.numpad_widget.findChildren(QPushButton)
+        }
+
+    def _dismiss_modal(self):
+        modal = QApplication.activeModalWidget()
+        if modal is not None:
+            self.unexpected_dialogs += 1
+            modal.close()
+
+    def _settle(self):
+        """Process events until the totals label shows the order total"""
+        expected = self.controller.get_order_totals()['total'].format()
+        deadline = time.perf_counter() + SETTLE_TIMEOUT_S
+        QApplication.processEvents()
+        while self.view.totals_widget.usd_amount.text() != expected:
+            if time.perf_counter() > deadline:
+                raise RuntimeError("Totals did not settle")
+            QApplication.processEvents()
+
+    def _settle_search(self):
+        """Process events until the grid has applied the search field's text"""
+        expected = self.view.search_input.text().strip()
+        deadline = time.perf_counter() + SETTLE_TIMEOUT_S
+        QApplication.processEvents()
+        while self.grid.search_text != expected:
+            if time.perf_counter() > deadline:
+                raise RuntimeError("Search did not settle")
+            QApplication.processEvents()
+        self._settle()
+
+    def _timed(self, action, settle=None):
+        """Run action() and return ms until the UI has settled"""
+        start = time.perf_counter()
+        action()
+        (settle or self._settle)()
+        return (time.perf_counter() - start) * 1000
+
+    # Order setup
+
+    def fill_order(self, line_count):
+        """Replace the order with line_count lines from the later categories"""
+        self.controller.clear_order()
+        filler = [
+            name for category in self.categories[2:]
+            for name in self.products_by_category[category]
+        ]
+        service = self.controller.product_service
+        for name in filler[:line_count]:
+            product_id = service.get_product_ids_by_name(name)[0]
+            self.controller.add_product_to_order(service.get_product(product_id))
+        self._settle()
+
+    def _show_category(self, index):
+        self.grid._show_category_items(self.categories[index])
+        QApplication.processEvents()
+
+    def _visible_product_buttons(self):
+        page = self.grid.pages_stack.currentWidget()
+        return [btn for btn in page.buttons if btn.isVisible()]
+
+    def _undo_last_line(self):
+        items = self.controller.get_order_items()
+        self.controller.remove_item_from_order(items[-1])
+        self.view._reset_button_protection()
+        self.view.button_protection_timer.stop()
+        self._settle()
+
+    # Scenarios
+
+    def product_tap(self):
+        self._show_category(0)
+        samples = []
+        buttons = self._visible_product_buttons()
+        for i in range(self.iterations):
+            button = buttons[i % len(buttons)]
+            samples.append(self._timed(lambda: QTest.mouseClick(button, Qt.LeftButton)))
+            self._undo_last_line()
+        return samples
+
+    def category_switch(self):
+        samples = []
+        for i in range(self.iterations):
+            button = self.grid.category_buttons[self.categories[(i + 1) % 2]]
+            samples.append(self._timed(lambda: QTest.mouseClick(button, Qt.LeftButton)))
+        return samples
+
+    def _search_samples(self, type_char):
+        """Type SEARCH_TEXT repeatedly, timing each character until the grid applies it"""
+        search_input = self.view.search_input
+        samples = []
+        while len(samples) < self.iterations:
+            for char in SEARCH_TEXT:
+                samples.append(self._timed(lambda: type_char(char), self._settle_search))
+            search_input.clear_search()
+            self._settle_search()
+        self.view.keyboard.hide()
+        return samples[:self.iterations]
+
+    def search_keystroke(self):
+        search_input = self.view.search_input
+
+        def type_char(char):
+            QTest.keyClick(search_input, char)
+            self.view.top_bar.flush_search()
+
+        return self._search_samples(type_char)
+
+    def search_debounced(self):
+        search_input = self.view.search_input
+        return self._search_samples(lambda char: QTest.keyClick(search_input, char))
+
+    def numpad_quantity(self):
+        self._show_category(0)
+        samples = []
+        buttons = self._visible_product_buttons()
+        for i in range(self.iterations):
+            button = buttons[i % len(buttons)]
+
+            def enter_quantity():
+                QTest.mouseClick(self.numpad_buttons['3'], Qt.LeftButton)
+                QTest.mouseClick(button, Qt.LeftButton)
+
+            samples.append(self._timed(enter_quantity))
+            self._undo_last_line()
+        return samples
+
+    def line_select(self):
+        view = self.view.order_list.order_list_view
+        model = self.view.order_list.model
+        samples = []
+        for i in range(self.iterations):
+            # Alternate between the first two lines (or keep tapping the only one)
+            rect = view.visualRect(model.index(i % min(2, model.rowCount())))
+            samples.append(self._timed(
+                lambda: QTest.mouseClick(view.viewport(), Qt.LeftButton, pos=rect.center())
+            ))
+        return samples
+
+    def line_remove(self):
+        order_list = self.view.order_list
+        view = order_list.order_list_view
+        samples = []
+        for _ in range(self.iterations):
+            item = order_list.model.item_at(0)
+            rect = view.visualRect(order_list.model.index(0))
+            QTest.mouseClick(view.viewport(), Qt.LeftButton, pos=rect.center())
+            self._settle()
+            samples.append(self._timed(order_list.remove_selected_item))
+
+            # Put the line back at the end of the order
+            product = self.controller.get_product(item.product_id)
+            self.controller.add_product_to_order(product, item.quantity)
+            self._settle()
+        return samples
+
+    def payment_press(self):
+        payment_button = self.view.cash_usd_widget.payment_btn
+        samples = []
+        for _ in range(self.iterations):
+            amount = str(int(self.controller.get_order_totals()['total'].to_major()) + 1)
+            for digit in amount:
+                QTest.mouseClick(self.numpad_buttons[digit], Qt.LeftButton)
+            self._settle()
+            samples.append(self._timed(lambda: QTest.mouseClick(payment_button, Qt.LeftButton)))
+        return samples
+
+    SCENARIOS = [
+        'product_tap', 'category_switch', 'search_keystroke', 'search_debounced',
+        'numpad_quantity',
+        'line_select', 'line_remove', 'payment_press',
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--output', help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    app = QApplication([])
+    results = {}
+
+    # The app prints debug lines for every order change; keep them out of
+    # the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        bench = LatencyBench(args.iterations)
+        for line_count in ORDER_SIZES:
+            bench.fill_order(line_count)
+            results[line_count] = {
+                name: getattr(bench, name)() for name in LatencyBench.SCENARIOS
+            }
+
+    report = {}
+    print(f"{'scenario':<18}{'lines':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for line_count, scenarios in results.items():
+        for name, samples in scenarios.items():
+            ordered = sorted(samples)
+            stats = {
+                'p50': round(percentile(ordered, 0.50), 3),
+                'p95': round(percentile(ordered, 0.95), 3),
+                'p99': round(percentile(ordered, 0.99), 3),
+                'samples': len(ordered),
+            }
+            report.setdefault(str(line_count), {})[name] = stats
+            print(f"{name:<18}{line_count:>6}{stats['p50']:>10.3f}"
+                  f"{stats['p95']:>10.3f}{stats['p99']:>10.3f}")
+
+    if bench.unexpected_dialogs:
+        print(f"Warning: {bench.unexpected_dialogs} dialogs were closed during the run")
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'iterations': args.iterations,
+                'unexpected_dialogs': bench.unexpected_dialogs,
+                'results': report,
+            }, output_file, indent=2)
+        print(f"Results written to {args.output}")
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -49,6 +49,9 @@ class AuthenticationContainer(QFrame):
         
         if not hasattr(self, 'pin_view'):
             self.pin_view = PinView(user_id, self)
+        else:
+            # Reuse the PIN view; only its user and input state change
+            self.pin_view.reset(user_id)
         self.pin_view.show()
         self.pin_view.setFocus()
 
@@ -1,8 +1,8 @@
 from PyQt5.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
-from PyQt5.QtGui import QPixmap, QIcon, QPainter
+from PyQt5.QtGui import QPixmap
 from PyQt5.QtCore import QSize, Qt, pyqtSignal
-from PyQt5.QtSvg import QSvgRenderer
 from utilities.utils import ApplicationUtils
+from services.icon_service import IconService
 from styles import AuthStyles
 from config.layouts.auth_layout import AuthLayoutConfig
 
@@ -95,15 +95,9 @@ class AuthTopBar(QFrame):
         
         # Load SVG icon
         icon_size = exit_config['icon_size']
-        renderer = QSvgRenderer("assets/images/exit_app.svg")
-        pixmap = QPixmap(icon_size, icon_size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
         
         # Set icon and style
-        exit_btn.setIcon(QIcon(pixmap))
+        exit_btn.setIcon(IconService.get_instance().icon("exit_app.svg", icon_size))
         exit_btn.setIconSize(QSize(icon_size, icon_size))
         exit_btn.setStyleSheet(AuthStyles.get_exit_button_style())
         
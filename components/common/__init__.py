@@ -3,5 +3,6 @@
 
 from .top_bar_widget import TopBarWidget
 from .search_widget import SearchWidget, KeyboardEnabledSearchWidget
+from .lazy_widget import LazyWidget
 
-__all__ = ['TopBarWidget', 'SearchWidget' , 'KeyboardEnabledSearchWidget']
\ No newline at end of file
+__all__ = ['TopBarWidget', 'SearchWidget' , 'KeyboardEnabledSearchWidget', 'LazyWidget']
\ No newline at end of file
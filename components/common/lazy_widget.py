@@ -0,0 +1,42 @@
+# components/common/lazy_widget.py
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+
+class LazyWidget(QWidget):
+    """
+    Placeholder that builds its real widget on first use.
+
+    The placeholder takes the widget's place in a layout right away. The
+    widget itself is created by the factory the first time widget() is
+    called, either on first use or from an idle-time build queue, and is
+    then shown inside the placeholder.
+    """
+
+    def __init__(self, factory, on_created=None, parent=None):
+        """
+        Args:
+            factory: Callable returning the real widget
+            on_created: Optional callable run once with the new widget,
+                e.g. to connect its signals
+        """
+        super().__init__(parent)
+        self._factory = factory
+        self._on_created = on_created
+        self._widget = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+    @property
+    def is_created(self):
+        """Whether the real widget has been built"""
+        return self._widget is not None
+
+    def widget(self):
+        """Get the real widget, building it if needed"""
+        if self._widget is None:
+            self._widget = self._factory()
+            self.layout().addWidget(self._widget)
+            if self._on_created:
+                self._on_created(self._widget)
+        return self._widget
@@ -1,9 +1,9 @@
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPainter, QPixmap
-from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtGui import QPainter
 from components.keyboard import KeyboardEnabledInput, KeyboardType, KeyboardManager
 from config.layouts.search_layout import search_layout_config
 from styles.components import SearchStyles
+from services.icon_service import IconService
 
 class SearchWidget(KeyboardEnabledInput):
     """Widget for handling product search with virtual keyboard support"""
@@ -36,12 +36,7 @@ class SearchWidget(KeyboardEnabledInput):
         icon_size = self.search_config.get_size('icon_size')
             
         # Load search icon
-        search_icon = QSvgRenderer("assets/images/search.svg")
-        self.search_pixmap = QPixmap(icon_size, icon_size)
-        self.search_pixmap.fill(Qt.transparent)
-        painter = QPainter(self.search_pixmap)
-        search_icon.render(painter)
-        painter.end()
+        self.search_pixmap = IconService.get_instance().pixmap("search.svg", icon_size)
 
     def _on_text_changed(self, text):
         """Handle text changes and emit search signal"""
@@ -55,7 +50,8 @@ class SearchWidget(KeyboardEnabledInput):
         # Get icon margin from config
         margin_left = self.search_config.get_size('icon_margin_left')
             
-        icon_size = self.search_pixmap.width()
+        # Logical size; the cached pixmap is rendered at the device pixel ratio
+        icon_size = round(self.search_pixmap.width() / self.search_pixmap.devicePixelRatio())
         painter.drawPixmap(margin_left, (self.height() - icon_size) // 2, self.search_pixmap)
 
     def clear_search(self):
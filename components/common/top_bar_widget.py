@@ -1,11 +1,11 @@
 # components/common/top_bar/top_bar_widget.py
 from PyQt5.QtWidgets import QFrame, QHBoxLayout, QVBoxLayout, QLabel, QPushButton
-from PyQt5.QtCore import Qt, QSize, QTimer, QDateTime, pyqtSignal
-from PyQt5.QtGui import QPixmap, QIcon, QPainter, QFont
-from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtCore import QSize, QTimer, QDateTime, pyqtSignal
+from PyQt5.QtGui import QFont
 
 from config.layouts.top_bar_layout import top_bar_layout_config
 from styles.top_bar import TopBarStyles
+from services.icon_service import IconService
 from components.common.search_widget import KeyboardEnabledSearchWidget
 
 class TopBarWidget(QFrame):
@@ -13,26 +13,43 @@ class TopBarWidget(QFrame):
     Standard top bar widget component used across different views.
     
     Signals:
-        search_changed: Emitted when the search text changes
+        search_changed: Emitted when the search text settles (debounced)
         lock_clicked: Emitted when the lock button is clicked
     """
     
     # Define signals
     search_changed = pyqtSignal(str)
     lock_clicked = pyqtSignal()
+
+    # Idle time before a typed search query is forwarded
+    SEARCH_DEBOUNCE_MS = 80
     
-    def __init__(self, user_id=None, user_name=None, parent=None):
+    def __init__(self, user_id=None, user_name=None, parent=None, search_debounce_ms=None):
         """
         Initialize the top bar widget.
         
         Args:
             user_id (str, optional): Employee ID to display
             parent (QWidget, optional): Parent widget
+            search_debounce_ms (int, optional): Search idle time in ms,
+                defaults to SEARCH_DEBOUNCE_MS; 0 forwards every change
         """
         super().__init__(parent)
         
         self.user_id = user_id
         self.user_name = user_name
+
+        # Debounce search input: intermediate queries are dropped and only
+        # the latest one is forwarded once typing pauses
+        if search_debounce_ms is None:
+            search_debounce_ms = self.SEARCH_DEBOUNCE_MS
+        self.search_debounce_ms = search_debounce_ms
+        self._pending_search = None
+        self._last_emitted_search = ""
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(search_debounce_ms)
+        self.search_timer.timeout.connect(self.flush_search)
         
         # Set style
         self.setStyleSheet(TopBarStyles.get_top_bar_container_style())
@@ -96,14 +113,7 @@ class TopBarWidget(QFrame):
         
         # Load SVG icon
         icon_size = emp_config['icon_size']
-        renderer = QSvgRenderer("assets/images/employee_icon.svg")
-        pixmap = QPixmap(icon_size, icon_size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        
-        emp_icon.setPixmap(pixmap)
+        emp_icon.setPixmap(IconService.get_instance().pixmap("employee_icon.svg", icon_size))
         
         # Employee ID
         emp_id = QLabel(f"{self.user_name}" if self.user_name else "")
@@ -180,6 +190,7 @@ class TopBarWidget(QFrame):
         # Create and connect search widget
         self.search_input = KeyboardEnabledSearchWidget(self)
         self.search_input.search_changed.connect(self._on_search_changed)
+        self.search_input.returnPressed.connect(self.flush_search)
         center_layout.addWidget(self.search_input)
         
         center_layout.addStretch(1)
@@ -201,14 +212,7 @@ class TopBarWidget(QFrame):
         
         # Load SVG icon
         icon_size = lock_config['icon_size']
-        renderer = QSvgRenderer("assets/images/lock_screen.svg")
-        pixmap = QPixmap(icon_size, icon_size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        
-        self.lock_btn.setIcon(QIcon(pixmap))
+        self.lock_btn.setIcon(IconService.get_instance().icon("lock_screen.svg", icon_size))
         self.lock_btn.setIconSize(QSize(icon_size, icon_size))
         self.lock_btn.setStyleSheet(TopBarStyles.get_lock_button_style())
         self.lock_btn.clicked.connect(self._handle_lock)
@@ -224,7 +228,28 @@ class TopBarWidget(QFrame):
         self.time_label.setText(current.toString("h:mm AP"))
     
     def _on_search_changed(self, text):
-        """Forward search signal"""
+        """Queue the search text, forwarding it once typing pauses"""
+        self._pending_search = text
+
+        # A cleared search is applied straight away so the full grid returns
+        if not text or self.search_debounce_ms <= 0:
+            self.flush_search()
+        else:
+            self.search_timer.start()
+
+    def flush_search(self):
+        """Forward the pending search text immediately (e.g. on Enter)"""
+        self.search_timer.stop()
+        if self._pending_search is None:
+            return
+
+        text = self._pending_search
+        self._pending_search = None
+
+        # Coalesce: skip if the grid already shows this query
+        if text == self._last_emitted_search:
+            return
+        self._last_emitted_search = text
         self.search_changed.emit(text)
     
     def _handle_lock(self):
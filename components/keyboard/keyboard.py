@@ -1,13 +1,14 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QPushButton, QFrame, QGridLayout, QLineEdit, QApplication)
+                            QPushButton, QFrame, QGridLayout, QLineEdit, QApplication,
+                            QStackedWidget, QSizePolicy)
 from PyQt5.QtCore import Qt, QEvent, QRect
-from PyQt5.QtGui import QPixmap, QPainter, QDoubleValidator
-from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtGui import QDoubleValidator
 from typing import Optional
 from .manager import KeyboardManager
 from .types import KeyboardType
 from config.layouts.keyboard_layout import keyboard_layout_config
 from styles.keyboard_styles import KeyboardStyles
+from services.icon_service import IconService
 
 class KeyboardEnabledInput(QLineEdit):
     """Input field that works with the virtual keyboard system"""
@@ -104,6 +105,8 @@ class VirtualKeyboard(QWidget):
         
         # Track current keyboard type
         self.current_keyboard_type = KeyboardType.FULL
+        # Key layouts built so far, by layout (see _layout_for)
+        self.keyboard_pages = {}
         
         self._setup_ui()
         self.hide()
@@ -117,8 +120,8 @@ class VirtualKeyboard(QWidget):
         # Handle bar
         self._setup_handle_bar()
 
-        # Keyboard container
-        self.keyboard_container = QWidget()
+        # Keyboard container: one page per keyboard type, built on first use
+        self.keyboard_container = QStackedWidget()
         self.main_layout.addWidget(self.keyboard_container)
 
         # Create initial keyboard layout
@@ -144,13 +147,7 @@ class VirtualKeyboard(QWidget):
 
         # Drag icon
         drag_icon = QLabel()
-        renderer = QSvgRenderer("assets/images/drag_icon.svg")
-        pixmap = QPixmap(24, 24)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        drag_icon.setPixmap(pixmap)
+        drag_icon.setPixmap(IconService.get_instance().pixmap("drag_icon.svg", 24))
         drag_icon.setStyleSheet("padding: 8px;")
         
         self.handle_layout.addWidget(drag_icon)
@@ -185,29 +182,47 @@ class VirtualKeyboard(QWidget):
         self.main_layout.addWidget(self.drag_handle)
 
     def _update_keyboard_layout(self):
-        """Update the keyboard layout based on current type"""
-        self._clear_keyboard_layout()
-        
-        if self.current_keyboard_type in [KeyboardType.NUMERIC, KeyboardType.DECIMAL, KeyboardType.PHONE]:
-            self._create_numeric_keyboard()
-        elif self.current_keyboard_type == KeyboardType.EMAIL:
-            self._create_email_keyboard()
-        elif self.current_keyboard_type == KeyboardType.SEARCH:
-            self._create_full_keyboard()  # Same as full but with search-specific keys
-        else:
-            self._create_full_keyboard()
+        """Show the layout for the current type, building it on first use"""
+        layout_type = self._layout_for(self.current_keyboard_type)
+        page = self.keyboard_pages.get(layout_type)
+        if page is None:
+            page = self._create_keyboard_page(layout_type)
+            self.keyboard_container.addWidget(page)
+            self.keyboard_pages[layout_type] = page
+
+        # Hidden pages must not count towards the keyboard's size hint
+        for other_page in self.keyboard_pages.values():
+            if other_page is not page:
+                other_page.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        page.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        self.keyboard_container.setCurrentWidget(page)
+        self.adjustSize()
 
-    def _clear_keyboard_layout(self):
-        """Remove all widgets from the keyboard container"""
-        if self.keyboard_container.layout():
-            while self.keyboard_container.layout().count():
-                item = self.keyboard_container.layout().takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
+    @staticmethod
+    def _layout_for(keyboard_type):
+        """Keyboard type whose page has the same keys, so types share one page"""
+        if keyboard_type in [KeyboardType.NUMERIC, KeyboardType.PHONE]:
+            return KeyboardType.NUMERIC
+        if keyboard_type == KeyboardType.DECIMAL:
+            return KeyboardType.DECIMAL
+        # Email and search use the full layout until they get their own keys
+        return KeyboardType.FULL
+
+    def _create_keyboard_page(self, keyboard_type):
+        """Create the key layout for a keyboard type"""
+        if keyboard_type in [KeyboardType.NUMERIC, KeyboardType.DECIMAL, KeyboardType.PHONE]:
+            return self._create_numeric_keyboard(keyboard_type)
+        elif keyboard_type == KeyboardType.EMAIL:
+            return self._create_email_keyboard()
+        elif keyboard_type == KeyboardType.SEARCH:
+            return self._create_full_keyboard()  # Same as full but with search-specific keys
+        else:
+            return self._create_full_keyboard()
 
     def _create_full_keyboard(self):
         """Create standard QWERTY keyboard layout"""
-        keyboard_layout = QHBoxLayout(self.keyboard_container)
+        page = QWidget()
+        keyboard_layout = QHBoxLayout(page)
         keyboard_layout.setSpacing(5)
 
         # QWERTY Section
@@ -217,10 +232,12 @@ class VirtualKeyboard(QWidget):
         # Numpad Section
         numpad_widget = self._create_numpad_section()
         keyboard_layout.addWidget(numpad_widget, stretch=3)
+        return page
 
-    def _create_numeric_keyboard(self):
+    def _create_numeric_keyboard(self, keyboard_type):
         """Create numeric-only keyboard layout"""
-        layout = QGridLayout(self.keyboard_container)
+        page = QWidget()
+        layout = QGridLayout(page)
         layout.setSpacing(10)
         
         # Add number keys (0-9)
@@ -233,7 +250,7 @@ class VirtualKeyboard(QWidget):
             layout.addWidget(btn, *pos)
         
         # Add additional keys based on keyboard type
-        if self.current_keyboard_type == KeyboardType.DECIMAL:
+        if keyboard_type == KeyboardType.DECIMAL:
             decimal = self._create_key_button('.')
             decimal.clicked.connect(lambda: self._on_key_press('.'))
             layout.addWidget(decimal, 3, 1)
@@ -246,6 +263,7 @@ class VirtualKeyboard(QWidget):
         clear = self._create_key_button('CLR')
         clear.clicked.connect(self._on_clear)
         layout.addWidget(clear, 3, 0)
+        return page
 
     def _create_qwerty_section(self):
         """Create the QWERTY section of the keyboard"""
@@ -307,9 +325,9 @@ class VirtualKeyboard(QWidget):
 
     def _create_email_keyboard(self):
         """Create email-specific keyboard layout"""
-        self._create_full_keyboard()
         # Add email-specific buttons (like @, .com, etc.)
         # This can be expanded based on requirements
+        return self._create_full_keyboard()
 
     def _create_bottom_row(self):
         """Create the bottom row with space and enter buttons"""
@@ -373,22 +391,15 @@ class VirtualKeyboard(QWidget):
     def _on_key_press(self, key):
         """Handle key press events"""
         if self.current_input:
-            cursor_pos = self.current_input.cursorPosition()
-            current_text = self.current_input.text()
-            new_text = current_text[:cursor_pos] + key + current_text[cursor_pos:]
-            self.current_input.setText(new_text)
-            self.current_input.setCursorPosition(cursor_pos + 1)
+            # Inserts at the cursor (replacing any selection) and keeps the
+            # input's undo history and validator in play
+            self.current_input.insert(key)
             self.current_input.setFocus()
 
     def _on_backspace(self):
         """Handle backspace key press"""
         if self.current_input:
-            cursor_pos = self.current_input.cursorPosition()
-            current_text = self.current_input.text()
-            if cursor_pos > 0:
-                new_text = current_text[:cursor_pos-1] + current_text[cursor_pos:]
-                self.current_input.setText(new_text)
-                self.current_input.setCursorPosition(cursor_pos - 1)
+            self.current_input.backspace()
             self.current_input.setFocus()
 
     def _on_clear(self):
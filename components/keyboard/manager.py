@@ -32,11 +32,24 @@ class KeyboardManager:
         """Initialize the keyboard manager"""
         self.current_input = None
         self.keyboard = None
+        self.keyboard_factory = None
         self.registered_inputs = set()
         
     def register_keyboard(self, keyboard):
         """Register the virtual keyboard instance"""
         self.keyboard = keyboard
+
+    def register_keyboard_factory(self, factory):
+        """Register a callable that builds the keyboard when first shown"""
+        self.keyboard = None
+        self.keyboard_factory = factory
+
+    def _ensure_keyboard(self):
+        """Build the keyboard from the registered factory if needed"""
+        if self.keyboard is None and self.keyboard_factory is not None:
+            # The keyboard registers itself on construction
+            self.keyboard_factory()
+        return self.keyboard
         
     def register_input(self, input_widget):
         """Register an input widget to use the virtual keyboard"""
@@ -56,7 +69,7 @@ class KeyboardManager:
     
     def show_keyboard(self, input_widget, keyboard_type=KeyboardType.FULL):
         """Show keyboard for a specific input widget with specified type"""
-        if self.keyboard and input_widget in self.registered_inputs:
+        if input_widget in self.registered_inputs and self._ensure_keyboard():
             self.current_input = input_widget
             
             # If keyboard is minimized, restore it first
@@ -0,0 +1,85 @@
+# components/pos/order_line_delegate.py
+from PyQt5.QtWidgets import QStyledItemDelegate
+from PyQt5.QtCore import Qt, QSize, QRect
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from components.pos.order_lines_model import OrderLinesModel
+from styles.order_widgets import OrderWidgetStyles
+from config.layouts.order_list_layout import order_layout_config
+
+class OrderLineDelegate(QStyledItemDelegate):
+    """Paints order lines as quantity | name | total rows"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Fonts, sizes and colors are resolved once, not per painted row
+        self.font = QFont()
+        self.font.setPointSize(order_layout_config.get_styling()['font_size'])
+        self.font_metrics = QFontMetrics(self.font)
+
+        self.label_widths = order_layout_config.get_label_widths()
+        self.margins = order_layout_config.get_item_margins()
+        self.padding = order_layout_config.get_item_padding()
+        self.spacing = order_layout_config.get_list_layout()['spacing']
+
+        colors = OrderWidgetStyles.get_order_item_colors()
+        self.background_color = QColor(colors['background'])
+        self.text_color = QColor(colors['text'])
+        self.selected_background_color = QColor(colors['selected_background'])
+        self.selected_border_pen = QPen(QColor(colors['selected_border']))
+        self.selected_border_radius = colors['selected_border_radius']
+
+        self._row_height = (
+            self.font_metrics.height()
+            + 2 * self.padding
+            + self.margins[1] + self.margins[3]
+        )
+
+    def sizeHint(self, option, index):
+        """All rows share one height"""
+        return QSize(option.rect.width(), self._row_height + self.spacing)
+
+    def paint(self, painter, option, index):
+        """Paint one order line"""
+        painter.save()
+
+        # Leave the list spacing below each row
+        row_rect = option.rect.adjusted(0, 0, 0, -self.spacing)
+        if index.data(OrderLinesModel.SelectedRole):
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self.selected_border_pen)
+            painter.setBrush(self.selected_background_color)
+            radius = self.selected_border_radius
+            painter.drawRoundedRect(row_rect.adjusted(0, 0, -1, -1), radius, radius)
+        else:
+            painter.fillRect(row_rect, self.background_color)
+
+        content = row_rect.adjusted(
+            self.margins[0] + self.padding,
+            self.margins[1] + self.padding,
+            -(self.margins[2] + self.padding),
+            -(self.margins[3] + self.padding)
+        )
+        qty_width = self.label_widths['quantity']
+        total_width = self.label_widths['total']
+
+        qty_rect = QRect(content.left(), content.top(), qty_width, content.height())
+        total_rect = QRect(
+            content.right() - total_width + 1, content.top(), total_width, content.height()
+        )
+        name_rect = QRect(
+            qty_rect.right() + 1 + self.padding, content.top(),
+            total_rect.left() - qty_rect.right() - 1 - 2 * self.padding, content.height()
+        )
+
+        painter.setFont(self.font)
+        painter.setPen(self.text_color)
+        painter.drawText(qty_rect, Qt.AlignCenter, index.data(OrderLinesModel.QuantityRole))
+        name = self.font_metrics.elidedText(
+            index.data(Qt.DisplayRole), Qt.ElideRight, name_rect.width()
+        )
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+        painter.drawText(
+            total_rect, Qt.AlignRight | Qt.AlignVCenter, index.data(OrderLinesModel.TotalRole)
+        )
+
+        painter.restore()
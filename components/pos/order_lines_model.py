@@ -0,0 +1,123 @@
+# components/pos/order_lines_model.py
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+from models.order_item import OrderItem
+
+class OrderLinesModel(QAbstractListModel):
+    """List model of the current order's lines, updated one line at a time
+
+    The model also holds the selected line, so changing the selection only
+    touches the previously and newly selected rows.
+    """
+
+    # Custom data roles
+    ItemRole = Qt.UserRole + 1
+    QuantityRole = Qt.UserRole + 2
+    TotalRole = Qt.UserRole + 3
+    SelectedRole = Qt.UserRole + 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
+        self._rows = {}  # line key -> row
+        self._selected_key = None
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of order lines"""
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Data of one order line for the given role"""
+        if not index.isValid() or index.row() >= len(self._items):
+            return None
+
+        item = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return item.name
+        if role == self.ItemRole:
+            return item
+        if role == self.QuantityRole:
+            return str(item.quantity)
+        if role == self.TotalRole:
+            return item.get_total().format(symbol=False)
+        if role == self.SelectedRole:
+            return item.line_key == self._selected_key
+        return None
+
+    @property
+    def items(self):
+        """Order items in display order"""
+        return list(self._items)
+
+    def item_at(self, row):
+        """Order item at a row, or None"""
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def row_of(self, item: OrderItem):
+        """Row of an item's line, or -1"""
+        return self._rows.get(item.line_key, -1)
+
+    @property
+    def selected_item(self):
+        """The selected order item, or None"""
+        row = self._rows.get(self._selected_key, -1)
+        return self.item_at(row)
+
+    def set_selected_row(self, row: int) -> None:
+        """Select the line at a row; an invalid row clears the selection"""
+        item = self.item_at(row)
+        key = item.line_key if item is not None else None
+        if key == self._selected_key:
+            return
+
+        previous_row = self._rows.get(self._selected_key, -1)
+        self._selected_key = key
+        # Only the old and new selected rows are repainted
+        for changed_row in (previous_row, row if item is not None else -1):
+            if changed_row >= 0:
+                index = self.index(changed_row)
+                self.dataChanged.emit(index, index, [self.SelectedRole])
+
+    def add_line(self, item: OrderItem) -> None:
+        """Append a new order line"""
+        row = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(item)
+        self._rows[item.line_key] = row
+        self.endInsertRows()
+
+    def update_line(self, item: OrderItem) -> None:
+        """Report that an order line's quantity or total changed"""
+        row = self.row_of(item)
+        if row < 0:
+            self.add_line(item)
+            return
+        self._items[row] = item
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_line(self, item: OrderItem) -> None:
+        """Remove an order line"""
+        row = self.row_of(item)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._items[row]
+        del self._rows[item.line_key]
+        if item.line_key == self._selected_key:
+            self._selected_key = None
+        # Lines below the removed one move up by one row
+        for later_item in self._items[row:]:
+            self._rows[later_item.line_key] -= 1
+        self.endRemoveRows()
+
+    def clear_lines(self) -> None:
+        """Remove all order lines"""
+        self.beginResetModel()
+        self._items = []
+        self._rows = {}
+        self._selected_key = None
+        self.endResetModel()
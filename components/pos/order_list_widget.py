@@ -1,9 +1,12 @@
 # components/pos/order_list_widget.py
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QFrame, QScrollArea, QToolButton, QMenu, QMessageBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QEvent
+from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QFrame, QListView,
+                            QAbstractItemView, QToolButton, QMenu, QMessageBox)
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 from models.order_item import OrderItem
+from models.money import Money
+from components.pos.order_lines_model import OrderLinesModel
+from components.pos.order_line_delegate import OrderLineDelegate
 from styles.order_widgets import OrderWidgetStyles
 from config.layouts.order_list_layout import order_layout_config
 
@@ -15,11 +18,17 @@ class OrderListWidget(QFrame):
     item_removed = pyqtSignal(OrderItem)
     order_cleared = pyqtSignal()
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, order_totals=None):
+        """
+        Args:
+            order_totals: Optional callable returning the order's running
+                totals (see OrderService.get_totals)
+        """
         super().__init__(parent)
-        self.order_items = []
-        self.selected_item = None
-        self.item_widgets = {} 
+        # Order lines live in a model painted by a delegate; only the
+        # visible rows are drawn
+        self.model = OrderLinesModel(self)
+        self.order_totals = order_totals
 
         # Apply styling
         self.setStyleSheet(OrderWidgetStyles.get_order_container_style())
@@ -48,30 +57,22 @@ class OrderListWidget(QFrame):
         layout.addWidget(self._create_header())
         
         # Order Items Area
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        
-        # Set scroll area dimensions from config
-        scroll_config = order_layout_config.get_scrollbar_config()
-        scroll_style = OrderWidgetStyles.get_scroll_area_style()
-        self.scroll_area.setStyleSheet(scroll_style)
-        
-        self.order_list_widget = QWidget()
-        list_style = OrderWidgetStyles.get_order_list_widget_style()
-        self.order_list_widget.setStyleSheet(list_style)
-        
-        self.order_list_layout = QVBoxLayout(self.order_list_widget)
-        
+        self.order_list_view = QListView()
+        self.order_list_view.setModel(self.model)
+        self.order_list_view.setItemDelegate(OrderLineDelegate(self.order_list_view))
+        self.order_list_view.setUniformItemSizes(True)
+        # Selection is kept by the model (see OrderLinesModel.SelectedRole)
+        self.order_list_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.order_list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.order_list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.order_list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.order_list_view.setStyleSheet(OrderWidgetStyles.get_order_list_view_style())
+
         content_margin = list_config['content_margin']
-        spacing = list_config['spacing']
-        self.order_list_layout.setContentsMargins(
+        self.order_list_view.setContentsMargins(
             content_margin, content_margin, content_margin, content_margin
         )
-        self.order_list_layout.setSpacing(spacing)
-        self.order_list_layout.addStretch()
-        
-        self.scroll_area.setWidget(self.order_list_widget)
-        layout.addWidget(self.scroll_area)
+        layout.addWidget(self.order_list_view)
         
         # Quantity Summary
         self.qty_summary = self._create_quantity_summary()
@@ -158,71 +159,31 @@ class OrderListWidget(QFrame):
         
         return summary_frame
 
-    def _add_item_to_display(self, item: OrderItem) -> None:
+    @property
+    def order_items(self):
+        """Items currently displayed, in display order"""
+        return self.model.items
+
+    @property
+    def selected_item(self):
+        """The selected order item, or None"""
+        return self.model.selected_item
+
+    def add_line(self, item: OrderItem) -> None:
         """Add a new item row to the order display"""
-        # Remove stretch if exists
-        self._remove_stretch()
-        
-        # Create item row
-        item_widget = QFrame()
-        item_widget.setProperty('selected', False)
-        # Use centralized order item style
-        item_widget.setStyleSheet(OrderWidgetStyles.get_order_item_style())
-        
-        item_layout = QHBoxLayout(item_widget)
-        # Get margins from order_layout_config
-        margins = order_layout_config.get_item_margins()
-        item_layout.setContentsMargins(
-            margins[0],  # left margin
-            margins[1],  # top margin
-            margins[2],  # right margin
-            margins[3]   # bottom margin
-        )
-        
-        # Get item padding from config and apply it
-        item_padding = order_layout_config.get_item_padding()
-        item_widget.setContentsMargins(item_padding, item_padding, item_padding, item_padding)
-        
-        # Quantity
-        label_widths = order_layout_config.get_label_widths()
-        qty_label = QLabel(str(item.quantity))
-        
-        # Apply font from config
-        font_size = order_layout_config.get_styling()['font_size']
-        font = QFont()
-        font.setPointSize(font_size)
-        qty_label.setFont(font)
-        
-        # Use width from config
-        qty_label.setFixedWidth(label_widths['quantity'])
-        qty_label.setAlignment(Qt.AlignCenter)
-        
-        # Name
-        name_label = QLabel(item.name)
-        name_label.setFont(font)  # Use same font
-        
-        # Total
-        total_label = QLabel(f"{item.get_total():.2f}")
-        total_label.setFont(font)  # Use same font
-        total_label.setAlignment(Qt.AlignRight)
-        # Use width from config
-        total_label.setFixedWidth(label_widths['total'])
-        
-        item_layout.addWidget(qty_label)
-        item_layout.addWidget(name_label)
-        item_layout.addWidget(total_label)
-        
-        # Store reference to the order item
-        item_widget.order_item = item
-        self._setup_item_click_handling(item_widget)
-        
-        # Store widget in our dictionary with a unique key
-        item_key = f"{item.name}_{len(self.item_widgets)}"
-        self.item_widgets[item_key] = item_widget
-        item_widget.item_key = item_key
-        
-        self.order_list_layout.addWidget(item_widget)
-        self.order_list_layout.addStretch()
+        self.model.add_line(item)
+
+    def update_line(self, item: OrderItem) -> None:
+        """Refresh the quantity and total of an item's row"""
+        self.model.update_line(item)
+
+    def remove_line(self, item: OrderItem) -> None:
+        """Remove an item's row from the order display"""
+        self.model.remove_line(item)
+
+    def clear_lines(self) -> None:
+        """Remove all rows from the order display"""
+        self.model.clear_lines()
 
     def _on_menu_clicked(self):
         """Show the order actions menu"""
@@ -250,28 +211,12 @@ class OrderListWidget(QFrame):
         elif action == clear_item:
             self.remove_selected_item()
 
-    def _on_item_clicked(self, widget, event):
+    def _on_item_clicked(self, index):
         """Handle item selection"""
-        if event.button() == Qt.LeftButton:
-            self._select_item(widget)
-            self.item_selected.emit(widget.order_item)
-
-    def _select_item(self, widget):
-        """Update selection status of items"""
-        for i in range(self.order_list_layout.count()):
-            item = self.order_list_layout.itemAt(i).widget()
-            if item and isinstance(item, QFrame):
-                item.setProperty('selected', False)
-                item.setStyleSheet(OrderWidgetStyles.get_order_item_style())
-                item.style().unpolish(item)
-                item.style().polish(item)
-        
-        widget.setProperty('selected', True)
-        # Use new method for selected item style
-        widget.setStyleSheet(OrderWidgetStyles.get_order_item_selected_style())
-        widget.style().unpolish(widget)
-        widget.style().polish(widget)
-        self.selected_item = widget
+        self.model.set_selected_row(index.row())
+        item = self.model.item_at(index.row())
+        if item is not None:
+            self.item_selected.emit(item)
 
     def clear_order(self):
         """Clear all items from the order after confirmation"""
@@ -295,111 +240,50 @@ class OrderListWidget(QFrame):
         
         reply = msg_box.exec_()
         
+        # Rows are removed when the order reports the change
         if reply == QMessageBox.Yes:
-            self.order_items = []
-            self._update_display()
             self.order_cleared.emit()
 
     def remove_selected_item(self):
-        """Remove the currently selected item"""
-        if self.selected_item and hasattr(self.selected_item, 'order_item'):
-            item = self.selected_item.order_item
-            self.order_items.remove(item)
+        """Request removal of the currently selected item"""
+        item = self.selected_item
+        if item is not None:
             self.item_removed.emit(item)
-            self.selected_item = None
-            self._update_display()
 
     def remove_item(self, item):
-        """Remove a specific item from the order list
+        """Request removal of a specific item from the order
         
         Args:
             item: The OrderItem object to remove
         """
-        if item in self.order_items:
-            self.order_items.remove(item)
-            self._update_display()
-            self._update_quantity_summary()
+        if self.model.row_of(item) >= 0:
             self.item_removed.emit(item)
 
-    def _update_display(self):
-        """Update the entire order display"""
-        self._clear_display()
-        for item in self.order_items:
-            self._add_item_to_display(item)
-        self._update_quantity_summary()
-
-    def _clear_display(self):
-        """Clear all items from display"""
-        for i in reversed(range(self.order_list_layout.count())):
-            widget = self.order_list_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-    def _remove_stretch(self):
-        """Remove stretch from layout if it exists"""
-        for i in reversed(range(self.order_list_layout.count())):
-            if self.order_list_layout.itemAt(i).widget() is None:
-                self.order_list_layout.takeAt(i)
-
-    def _update_quantity_summary(self):
-        """Update the quantity summary label"""
-        total_qty = sum(item.quantity for item in self.order_items)
-        unique_items = len(self.order_items)
+    def update_quantity_summary(self, total_qty, unique_items):
+        """Update the quantity summary label from the order's running totals"""
         self.qty_summary_label.setText(f"Qty: {total_qty} | Items: {unique_items}")
 
     def clear_items(self):
-        """Clear all items from the order list"""
-        self.order_items = []
-        # Clear the UI display
-        self._clear_display()
-        # Update the quantity summary
-        self._update_quantity_summary()
-        # Emit order cleared signal
+        """Request clearing all items from the order without confirmation"""
         self.order_cleared.emit()
 
-    def _setup_item_click_handling(self, item_widget):
-        """Set up click handling for an item widget"""
-        item_widget.mousePressEvent = lambda event: self._on_item_click_event(item_widget, event)
-
-    def _on_item_click_event(self, widget, event):
-        """Handle mouse press events for item widgets"""
-        if event.button() == Qt.LeftButton:
-            self._select_item(widget)
-            self.item_selected.emit(widget.order_item)
-
-    # Add this method
-    def _on_widget_mouse_press(self, event):
-        """Global mouse press event handler"""
-        widget = self.sender()
-        if hasattr(widget, 'order_item') and event.button() == Qt.LeftButton:
-            self._select_item(widget)
-            self.item_selected.emit(widget.order_item)
-
-    def eventFilter(self, obj, event):
-        """Filter events for child widgets"""
-        if event.type() == QEvent.MouseButtonPress and hasattr(obj, 'order_item'):
-            if event.button() == Qt.LeftButton:
-                self._on_item_clicked(obj, event)
-                return True
-        return super().eventFilter(obj, event)
-    
-    def _connect_item_widget(self, widget):
-        """Connect signals for a newly created item widget"""
-        widget.mousePressEvent = widget.default_mouse_press_event
-        widget.installEventFilter(self)
-
     def _connect_signals(self):
         """Connect all widget signals to their handlers"""
         # Menu button connection
         self.menu_btn.clicked.connect(self._on_menu_clicked)
 
+        # Row clicks
+        self.order_list_view.clicked.connect(self._on_item_clicked)
 
     @property
     def total_amount(self):
-        """Calculate total amount for all items"""
-        return sum(item.get_total() for item in self.order_items)
+        """Total amount of the order, from the service's running totals"""
+        if self.order_totals is not None:
+            return self.order_totals()['total']
+        # Standalone widget without an order service
+        return sum((item.get_total() for item in self.order_items), Money.zero())
 
     @property
     def items_count(self):
         """Get total number of items"""
-        return len(self.order_items)
\ No newline at end of file
+        return self.model.rowCount()
\ No newline at end of file
@@ -39,8 +39,9 @@ class OrderTypeWidget(QFrame):
                 button_config['height']
             )
             
-            # Set initial style
-            btn.setStyleSheet(ButtonStyles.get_order_button_style(is_selected=False))
+            # Styled by the app stylesheet; selection switches a property
+            btn.setProperty('button_role', 'order_type')
+            btn.setProperty('selected', False)
             
             # Connect selection handler
             btn.clicked.connect(
@@ -64,11 +65,11 @@ class OrderTypeWidget(QFrame):
         # Reset previous selection if exists
         if self.selected_order_type:
             prev_btn = self.order_buttons[self.selected_order_type]
-            prev_btn.setStyleSheet(ButtonStyles.get_order_button_style(is_selected=False))
+            ButtonStyles.set_state(prev_btn, 'selected', False)
 
         # Update new selection
         curr_btn = self.order_buttons[order_type]
-        curr_btn.setStyleSheet(ButtonStyles.get_order_button_style(is_selected=True))
+        ButtonStyles.set_state(curr_btn, 'selected', True)
         
         self.selected_order_type = order_type
         self.order_type_changed.emit(order_type)
@@ -1,11 +1,12 @@
 # components/pos/product_grid_widget.py
-from PyQt5.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QPushButton, 
-                            QScrollArea, QWidget, QGridLayout)
+from collections import OrderedDict
+from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QStackedWidget
 from PyQt5.QtCore import Qt, pyqtSignal
 from styles import ButtonStyles
 from styles.layouts import layout_config
 from styles.grid_widgets import GridWidgetStyles
-from models.product_catalog import PRODUCTS_BY_CATEGORY, CATEGORIES
+from services.product_service import ProductService
+from components.pos.virtual_product_grid import VirtualProductGrid
 from button_definitions.types import CategoryButtonType
 from button_definitions.category import CategoryButtonConfig
 
@@ -13,22 +14,38 @@ class ProductGridWidget(QFrame):
     """Widget for displaying and managing product grid and categories"""
     
     # Signals
-    product_selected = pyqtSignal(str)  # Emits product name when selected
+    product_selected = pyqtSignal(int)  # Emits product ID when selected
     category_changed = pyqtSignal(str)  # Emits category name when changed
+
+    # Maximum number of category pages kept built in the page stack
+    MAX_CACHED_PAGES = 8
+
+    # Fewest search results fetched at once, used before the search page
+    # has been laid out and knows its own capacity
+    MIN_SEARCH_PAGE_SIZE = 24
     
-    def __init__(self, parent=None):
+    def __init__(self, product_service=None, parent=None):
         super().__init__(parent)
         # Use centralized style for container
         self.setStyleSheet(GridWidgetStyles.CONTAINER)
         
         self.layout_config = layout_config.get_instance()
-        self.categories = CATEGORIES
+        self.product_service = product_service or ProductService()
+        self.categories = self.product_service.get_all_categories()
         self.selected_category = None
         self.category_buttons = {}
         self.search_text = ""
+        # Search results are fetched one page at a time as the page scrolls
+        self.search_offset = 0
+        self.search_has_more = False
+        # Built category pages, least recently shown first
+        self.category_pages = OrderedDict()
+        # Product IDs styled as numpad-disabled, shared by every page
+        self.numpad_disabled_products = set()
         
         self.category_bar = self._create_category_bar()
         self._setup_ui()
+        self.product_service.add_catalog_listener(self._on_catalog_changed)
         # Initialize first category
         self._show_category_items(self.categories[0])
 
@@ -46,26 +63,35 @@ class ProductGridWidget(QFrame):
             self.layout_config.screen_config.get_size('product_grid_main_spacing')
         )
 
-        # Products Grid Area
-        self.products_scroll = QScrollArea()
-        self.products_scroll.setWidgetResizable(True)
-        # Use GridWidgetStyles instead of POSStyles
-        self.products_scroll.setStyleSheet(GridWidgetStyles.SCROLL_AREA)
+        # Products Grid Area: one page per category plus a search results page
+        # Product buttons (including the numpad-disabled state) are styled
+        # by the application stylesheet; the page style is set once here
+        self.pages_stack = QStackedWidget()
+        self.pages_stack.setStyleSheet(GridWidgetStyles.VIRTUAL_GRID)
+        self.search_page = self._create_page()
+        self.search_page.end_reached.connect(self._load_more_search_results)
+        self.pages_stack.addWidget(self.search_page)
         
-        products_container = QWidget()
-        self.products_grid = QGridLayout(products_container)
-        self.products_grid.setSpacing(
-            self.layout_config.screen_config.get_size('product_grid_items_spacing')
-        )
-        self.products_grid.setContentsMargins(
-            self.layout_config.screen_config.get_size('product_grid_items_margin_left'),
-            self.layout_config.screen_config.get_size('product_grid_items_margin_top'),
-            self.layout_config.screen_config.get_size('product_grid_items_margin_right'),
-            self.layout_config.screen_config.get_size('product_grid_items_margin_bottom')
+        main_layout.addWidget(self.pages_stack, 1)
+
+    def _create_page(self):
+        """Create an empty virtualized page of product buttons"""
+        grid_config = self.layout_config.get_product_grid_config()
+        screen_config = self.layout_config.screen_config
+        page = VirtualProductGrid(
+            self.product_service,
+            (grid_config['product_button']['width'], grid_config['product_button']['height']),
+            screen_config.get_size('product_grid_items_spacing'),
+            (
+                screen_config.get_size('product_grid_items_margin_left'),
+                screen_config.get_size('product_grid_items_margin_top'),
+                screen_config.get_size('product_grid_items_margin_right'),
+                screen_config.get_size('product_grid_items_margin_bottom')
+            ),
+            self.numpad_disabled_products
         )
-        self.products_scroll.setWidget(products_container)
-        
-        main_layout.addWidget(self.products_scroll, 1)
+        page.product_clicked.connect(self.product_selected)
+        return page
 
     def get_category_bar(self):
         """Return the category buttons bar widget"""
@@ -96,7 +122,8 @@ class ProductGridWidget(QFrame):
             btn = QPushButton(config['text'])
             
             grid_config = self.layout_config.get_product_grid_config()
-            btn.setStyleSheet(ButtonStyles.get_category_button_style(is_selected=False))
+            btn.setProperty('button_role', 'category')  # Styled by the app stylesheet
+            btn.setProperty('selected', False)
             btn.setFixedSize(
                 grid_config['category_button']['width'],
                 grid_config['category_button']['height']
@@ -116,102 +143,128 @@ class ProductGridWidget(QFrame):
             # Reset previously selected button
             if self.selected_category:
                 prev_btn = self.category_buttons[self.selected_category]
-                prev_btn.setStyleSheet(ButtonStyles.get_category_button_style(is_selected=False))
+                ButtonStyles.set_state(prev_btn, 'selected', False)
             
             # Update newly selected button
             curr_btn = self.category_buttons[category]
-            curr_btn.setStyleSheet(ButtonStyles.get_category_button_style(is_selected=True))
+            ButtonStyles.set_state(curr_btn, 'selected', True)
             self.selected_category = category
             self.category_changed.emit(category)
 
-        # Clear existing products grid
-        self._clear_grid()
+        if self.search_text:
+            # Search results are rebound onto the shared search page
+            self.search_page.set_product_ids(self._filter_items(category))
+            self.pages_stack.setCurrentWidget(self.search_page)
+        else:
+            self.pages_stack.setCurrentWidget(self._get_category_page(category))
 
-        # Get items and apply search filter
-        items = PRODUCTS_BY_CATEGORY[category]
-        filtered_items = self._filter_items(items)
+    def _get_category_page(self, category):
+        """Get a category's page, building it on first visit"""
+        page = self.category_pages.get(category)
+        if page is not None:
+            self.category_pages.move_to_end(category)
+            return page
 
-        # Add product buttons to grid
-        self._populate_grid(filtered_items)
+        page = self._create_page()
+        page.set_product_ids(self.product_service.get_product_ids_for_category(category))
+        self.pages_stack.addWidget(page)
+        self.category_pages[category] = page
 
-    def _clear_grid(self):
-        """Clear all items from the product grid"""
-        for i in reversed(range(self.products_grid.count())):
-            widget = self.products_grid.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        # Drop the least recently shown page beyond the cache bound
+        while len(self.category_pages) > self.MAX_CACHED_PAGES:
+            _, old_page = self.category_pages.popitem(last=False)
+            self._discard_page(old_page)
+        return page
 
-    def _filter_items(self, items):
-        """Filter items based on search text"""
-        if not self.search_text:
-            return items
-        return [item for item in items if self.search_text.lower() in item.lower()]
+    def _discard_page(self, page):
+        """Remove a page from the stack and delete it"""
+        self.pages_stack.removeWidget(page)
+        page.deleteLater()
 
-    def _populate_grid(self, items):
-        """Populate grid with product buttons"""
-        product_style = ButtonStyles.get_product_button_style()
-        grid_config = self.layout_config.get_product_grid_config()
+    def invalidate_category(self, category):
+        """Drop a category's cached page so it is rebuilt on its next visit"""
+        page = self.category_pages.pop(category, None)
+        if page is None:
+            return
+        self._discard_page(page)
+        if category == self.selected_category and not self.search_text:
+            self._show_category_items(category)
 
-        for i, item in enumerate(items):
-            btn = QPushButton(item)
-            btn.setProperty('product_name', item)  # Track product name
-            btn.setProperty('disabled_by_numpad', False)  # Track disabled state
-            btn.setFixedSize(
-                grid_config['product_button']['width'],
-                grid_config['product_button']['height']
-            )
-            btn.setStyleSheet(product_style)
-            btn.clicked.connect(lambda checked, name=item: self.product_selected.emit(name))
-            
-            row = i // 3  # 3 columns per row
-            col = i % 3
-            self.products_grid.addWidget(btn, row, col)
-
-    def find_product_button(self, product_name):
-        """Find a product button by its name"""
-        for i in range(self.products_grid.count()):
-            widget = self.products_grid.itemAt(i).widget()
-            if isinstance(widget, QPushButton) and widget.property('product_name') == product_name:
-                return widget
-        return None
+    def detach(self):
+        """Stop following catalog changes, e.g. before the grid is deleted"""
+        self.product_service.remove_catalog_listener(self._on_catalog_changed)
+
+    def _on_catalog_changed(self, changed_categories):
+        """Rebuild changed category pages and rebind product IDs on the rest"""
+        for category in list(self.category_pages):
+            if category in changed_categories:
+                self.invalidate_category(category)
+            else:
+                self.category_pages[category].rebind_product_ids(
+                    self.product_service.get_product_ids_for_category(category)
+                )
+        if self.search_text and self.selected_category:
+            self._show_category_items(self.selected_category)
+
+    def _filter_items(self, category):
+        """Get the first page of the category's product IDs matching the search text"""
+        self.search_offset = 0
+        return self._fetch_search_page(category)
+
+    def _fetch_search_page(self, category):
+        """Get the next page of search results and advance the offset"""
+        page_size = max(self.search_page.capacity, self.MIN_SEARCH_PAGE_SIZE)
+        product_ids = self.product_service.filter_category_product_ids(
+            category, self.search_text, limit=page_size, offset=self.search_offset
+        )
+        self.search_offset += len(product_ids)
+        self.search_has_more = len(product_ids) == page_size
+        return product_ids
+
+    def _load_more_search_results(self):
+        """Append the next page of search results once the last one is in view"""
+        if not self.search_text or not self.search_has_more or not self.selected_category:
+            return
+        self.search_page.append_product_ids(self._fetch_search_page(self.selected_category))
+
+    def _pages(self):
+        """All built pages, including the search page"""
+        return [self.search_page, *self.category_pages.values()]
+
+    def find_product_button(self, product_id):
+        """Find a product button in view on the current page by its product ID
+
+        Each page keeps a product ID to button table, so this does not
+        depend on the number of products.
+        """
+        return self.pages_stack.currentWidget().find_button(product_id)
     
-    def disable_button_temporarily(self, product_name):
+    def disable_button_temporarily(self, product_id):
         """Handle temporary button disable with styling"""
-        button = self.find_product_button(product_name)
+        button = self.find_product_button(product_id)
         if button:
-            self._apply_disabled_style(button)
+            # Pages read the shared set whenever they bind a button, so the
+            # state follows the product while scrolling and across pages
+            self.numpad_disabled_products.add(product_id)
+            for page in self._pages():
+                page.refresh_product(product_id)
             return True
         return False
 
-    def enable_button(self, product_name):
+    def enable_button(self, product_id):
         """Reset button to normal state"""
-        button = self.find_product_button(product_name)
-        if button:
-            self._reset_button_style(button)
-
-    def _apply_disabled_style(self, button):
-        """Apply disabled style to button"""
-        button.setProperty('disabled_by_numpad', True)
-        base_style = ButtonStyles.get_product_button_style()
-        # Use centralized style for disabled buttons
-        disabled_style = GridWidgetStyles.get_disabled_product_button_style(base_style)
-        button.setStyleSheet(disabled_style)
-        self._refresh_button_style(button)
-
-    def _reset_button_style(self, button):
-        """Reset button to normal style"""
-        button.setProperty('disabled_by_numpad', False)
-        button.setStyleSheet(ButtonStyles.get_product_button_style())
-        self._refresh_button_style(button)
-
-    def _refresh_button_style(self, button):
-        """Force button style refresh"""
-        button.style().unpolish(button)
-        button.style().polish(button)
-        button.update()
+        if product_id not in self.numpad_disabled_products:
+            return
+        self.numpad_disabled_products.discard(product_id)
+        for page in self._pages():
+            page.refresh_product(product_id)
 
     def set_search_text(self, text):
         """Update search filter and refresh grid"""
-        self.search_text = text.strip()
+        text = text.strip()
+        if text == self.search_text:
+            return
+
+        self.search_text = text
         if self.selected_category:
             self._show_category_items(self.selected_category)
\ No newline at end of file
@@ -2,6 +2,7 @@ from PyQt5.QtWidgets import QFrame, QVBoxLayout, QLabel, QHBoxLayout
 from PyQt5.QtCore import Qt
 from styles import POSStyles
 from styles.layouts import layout_config
+from models.money import Money, ExchangeRate
 
 class TotalsWidget(QFrame):
     """Widget for displaying order totals in USD and LBP"""
@@ -10,6 +11,8 @@ class TotalsWidget(QFrame):
         super().__init__(parent)
         self.layout_config = layout_config.get_instance()
         self.exchange_rate = exchange_rate
+        self.conversion = ExchangeRate(exchange_rate)
+        self.amount_usd = Money.zero()
         self.setStyleSheet(POSStyles.TOTALS_FRAME)
         self._setup_ui()
 
@@ -81,16 +84,16 @@ class TotalsWidget(QFrame):
         main_layout.addLayout(lbp_layout)
         main_layout.addStretch(1)
 
-    def update_totals(self, amount_usd):
+    def update_totals(self, amount_usd: Money):
         """Update total amounts in both currencies"""
-        total_lbp = amount_usd * self.exchange_rate
+        self.amount_usd = amount_usd
+        total_lbp = self.conversion.to_lbp(amount_usd)
         
-        self.usd_amount.setText(f"${amount_usd:,.2f}")
-        self.lbp_amount.setText(f"{int(total_lbp):,}")
+        self.usd_amount.setText(amount_usd.format())
+        self.lbp_amount.setText(total_lbp.format())
 
     def set_exchange_rate(self, rate):
         """Update the exchange rate and recalculate totals"""
         self.exchange_rate = rate
-        # Force update with current USD amount
-        current_usd = float(self.usd_amount.text().replace('$', '').replace(',', ''))
-        self.update_totals(current_usd)
\ No newline at end of file
+        self.conversion = ExchangeRate(rate)
+        self.update_totals(self.amount_usd)
\ No newline at end of file
@@ -0,0 +1,195 @@
+# components/pos/virtual_product_grid.py
+from PyQt5.QtWidgets import QAbstractScrollArea, QPushButton, QScroller, QScrollerProperties
+from PyQt5.QtCore import Qt, pyqtSignal
+from styles import ButtonStyles
+
+class VirtualProductGrid(QAbstractScrollArea):
+    """
+    Scrollable grid of product buttons that only creates buttons for the
+    rows in view (plus a few overscan rows).
+
+    The button count depends on the viewport size, not on the number of
+    products. Scrolling rebinds the existing buttons to the products that
+    come into view, and the column count follows the available width.
+
+    Signals:
+        product_clicked: Emitted with the product ID of a clicked button
+        end_reached: Emitted when the last product is bound to a button,
+            so a paged owner can append the next page
+    """
+
+    product_clicked = pyqtSignal(int)
+    end_reached = pyqtSignal()
+
+    # Extra rows kept bound above and below the viewport
+    OVERSCAN_ROWS = 1
+
+    def __init__(self, product_service, button_size, spacing, margins,
+                 disabled_products=None, parent=None):
+        """
+        Args:
+            product_service: ProductService used to resolve product names
+            button_size (tuple): (width, height) of a product button
+            spacing (int): Gap between buttons in pixels
+            margins (tuple): (left, top, right, bottom) content margins
+            disabled_products (set, optional): Product IDs shown as
+                numpad-disabled; shared with the owner and read on rebind
+        """
+        super().__init__(parent)
+        self.product_service = product_service
+        self.button_width, self.button_height = button_size
+        self.spacing = spacing
+        self.margins = margins
+        self.disabled_products = disabled_products if disabled_products is not None else set()
+
+        self.product_ids = []
+        self.buttons = []
+        # Bound buttons by product ID, kept in sync as buttons are rebound
+        self.buttons_by_product = {}
+        self.columns = 1
+        self.first_index = 0
+
+        self.setFrameShape(QAbstractScrollArea.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        # Kinetic (flick) scrolling for touch screens
+        QScroller.grabGesture(self.viewport(), QScroller.TouchGesture)
+        scroller_properties = QScroller.scroller(self.viewport()).scrollerProperties()
+        scroller_properties.setScrollMetric(
+            QScrollerProperties.VerticalOvershootPolicy,
+            QScrollerProperties.OvershootAlwaysOff
+        )
+        QScroller.scroller(self.viewport()).setScrollerProperties(scroller_properties)
+
+    @property
+    def row_height(self):
+        """Height of one row including spacing"""
+        return self.button_height + self.spacing
+
+    def set_product_ids(self, product_ids):
+        """Show a new list of products, scrolled to the top"""
+        self.product_ids = list(product_ids)
+        self.verticalScrollBar().setValue(0)
+        self._update_geometry()
+
+    def append_product_ids(self, product_ids):
+        """Add products after the current ones without moving the scroll position"""
+        self.product_ids.extend(product_ids)
+        self._update_geometry()
+
+    @property
+    def capacity(self):
+        """Number of products the button pool can show at once"""
+        return len(self.buttons)
+
+    def find_button(self, product_id):
+        """Find the button currently bound to a product, if it is in view"""
+        return self.buttons_by_product.get(product_id)
+
+    def refresh_product(self, product_id):
+        """Re-apply the disabled state of a product's button, if it is in view"""
+        btn = self.find_button(product_id)
+        if btn is not None:
+            self._apply_disabled_state(btn, product_id in self.disabled_products)
+
+    def rebind_product_ids(self, product_ids):
+        """Replace product IDs without moving the scroll position"""
+        self.product_ids = list(product_ids)
+        for btn in self.buttons:
+            btn.bound_index = None
+        self._layout_buttons()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_geometry()
+
+    def scrollContentsBy(self, dx, dy):
+        # Buttons are repositioned instead of scrolling viewport pixels
+        self._layout_buttons()
+
+    def _update_geometry(self):
+        """Recompute columns, scroll range and button pool for the viewport"""
+        left, top, right, bottom = self.margins
+        viewport = self.viewport()
+        available_width = viewport.width() - left - right
+        self.columns = max(1, (available_width + self.spacing) // (self.button_width + self.spacing))
+
+        rows = -(-len(self.product_ids) // self.columns)
+        content_height = top + bottom + max(0, rows * self.row_height - self.spacing)
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setRange(0, max(0, content_height - viewport.height()))
+        scroll_bar.setPageStep(viewport.height())
+        scroll_bar.setSingleStep(self.row_height)
+
+        visible_rows = -(-viewport.height() // self.row_height) + 1
+        self._ensure_buttons((visible_rows + 2 * self.OVERSCAN_ROWS) * self.columns)
+        for btn in self.buttons:
+            btn.bound_index = None
+        self._layout_buttons()
+
+    def _ensure_buttons(self, count):
+        """Create buttons until the pool holds count of them"""
+        while len(self.buttons) < count:
+            btn = QPushButton(self.viewport())
+            btn.setFixedSize(self.button_width, self.button_height)
+            btn.setProperty('button_role', 'product')  # Styled by the app stylesheet
+            btn.setProperty('product_id', None)  # Track product ID
+            btn.setProperty('disabled_by_numpad', False)  # Track disabled state
+            btn.bound_index = None
+            btn.clicked.connect(lambda checked, b=btn: self._on_button_clicked(b))
+            btn.hide()
+            self.buttons.append(btn)
+
+    def _layout_buttons(self):
+        """Bind and position pooled buttons for the rows in view"""
+        left, top, _, _ = self.margins
+        offset = self.verticalScrollBar().value()
+        first_row = max(0, (offset - top) // self.row_height - self.OVERSCAN_ROWS)
+        self.first_index = first_row * self.columns
+
+        for i, btn in enumerate(self.buttons):
+            index = self.first_index + i
+            if index >= len(self.product_ids):
+                # isVisible() is False on pages that are not current, so
+                # surplus buttons are always hidden and unbound
+                btn.hide()
+                self._unbind_button(btn)
+                btn.bound_index = None
+                continue
+
+            if btn.bound_index != index:
+                product_id = self.product_ids[index]
+                self._unbind_button(btn)
+                btn.setText(self.product_service.get_product(product_id).name)
+                btn.setProperty('product_id', product_id)
+                self.buttons_by_product[product_id] = btn
+                self._apply_disabled_state(btn, product_id in self.disabled_products)
+                btn.bound_index = index
+
+            row, col = divmod(index, self.columns)
+            btn.move(
+                left + col * (self.button_width + self.spacing),
+                top + row * self.row_height - offset
+            )
+            if btn.isHidden():
+                btn.show()
+
+        if self.product_ids and self.first_index + len(self.buttons) >= len(self.product_ids):
+            self.end_reached.emit()
+
+    def _unbind_button(self, btn):
+        """Drop a button's product binding from the lookup table"""
+        product_id = btn.property('product_id')
+        if self.buttons_by_product.get(product_id) is btn:
+            del self.buttons_by_product[product_id]
+        btn.setProperty('product_id', None)
+
+    def _apply_disabled_state(self, btn, disabled):
+        """Toggle the numpad-disabled look of a button"""
+        ButtonStyles.set_state(btn, 'disabled_by_numpad', disabled)
+
+    def _on_button_clicked(self, btn):
+        """Emit the product currently bound to a button"""
+        product_id = btn.property('product_id')
+        if product_id is not None:
+            self.product_clicked.emit(product_id)
@@ -73,6 +73,13 @@ class ScreenConfig:
         self._ensure_initialized()
         return self._current_config.get(element_name)
     
+    def set_screen_dimensions(self, width, height):
+        """Use fixed screen dimensions instead of detecting the primary screen"""
+        self._width = width
+        self._height = height
+        self._set_size_config()
+        self._initialized = True
+
     def get_screen_dimensions(self):
         """Get the screen dimensions"""
         self._ensure_initialized()
@@ -2,18 +2,19 @@ from services.payment_service import PaymentService
 from services.order_service import OrderService
 from services.product_service import ProductService
 from services.validation_service import ValidationService
-from button_definitions.types import PaymentButtonType
+from models.product import Product
+from models.money import Money
 from typing import Tuple, Dict, List, Any, Optional
 
 class POSController:
-    def __init__(self):
+    def __init__(self, product_service: Optional[ProductService] = None):
         # Initialize services
         self.payment_service = PaymentService()
         self.order_service = OrderService()
-        self.product_service = ProductService()
+        self.product_service = product_service or ProductService()
         self.validation_service = ValidationService()
         
-    def get_exchange_rate(self) -> float:
+    def get_exchange_rate(self) -> int:
         """Get current exchange rate from payment service"""
         return self.payment_service.get_exchange_rate()
         
@@ -22,7 +23,7 @@ class POSController:
         """Process payment through the payment service"""
         order_total = self.order_service.get_total()
         success, message, payment_info = self.payment_service.process_payment(
-            payment_type, value_str, float(order_total)
+            payment_type, value_str, order_total
         )
         
         if not success:
@@ -36,15 +37,14 @@ class POSController:
         return True, f"Payment of {payment_info['amount']} processed successfully"
     
     # Order-related methods
-    def add_product_to_order(self, product_name: str, quantity: int = 1) -> bool:
+    def add_product_to_order(self, product: Product, quantity: int = 1) -> bool:
         """Add a product to the current order"""
-        price = self.product_service.get_product_price(product_name)
-        if price <= 0:
-            print(f"Product {product_name} price not found or invalid")
+        if not product.is_priced:
+            print(f"Product {product.name} price not found or invalid")
             return False
             
-        print(f"Adding {quantity} x {product_name} at price {price}")
-        self.order_service.add_item(product_name, price, quantity)
+        print(f"Adding {quantity} x {product.name} at price {product.price}")
+        self.order_service.add_item(product.name, product.price, quantity, product_id=product.id)
         return True
 
         
@@ -59,34 +59,60 @@ class POSController:
         print("Clearing order")  # Debug print
         self.order_service.clear_order()
         
-    def update_item_quantity(self, item_name: str, quantity: int) -> None:
-        """Update an item's quantity"""
-        self.order_service.update_item_quantity(item_name, quantity)
+    def update_item_quantity(self, line_key, quantity: int) -> None:
+        """Update an order line's quantity"""
+        self.order_service.update_item_quantity(line_key, quantity)
         
-    def get_order_total(self) -> float:
+    def get_order_total(self) -> Money:
         """Get the total for the current order"""
-        return float(self.order_service.get_total())
+        return self.order_service.get_total()
+
+    def add_order_listener(self, listener) -> None:
+        """Register a callback(event, item) for order changes"""
+        self.order_service.add_listener(listener)
+
+    def remove_order_listener(self, listener) -> None:
+        """Unregister an order change callback"""
+        self.order_service.remove_listener(listener)
+
+    def get_order_totals(self) -> Dict[str, Any]:
+        """Get the running subtotal, discount, total and counts of the current order"""
+        return self.order_service.get_totals()
         
     def set_order_type(self, order_type: str) -> None:
         """Set the order type"""
         self.order_service.set_order_type(order_type)
         
+    def get_order_items(self) -> List[Any]:
+        """Get the items of the current order in display order"""
+        return self.order_service.current_order_items
+
     def get_order_summary(self) -> Dict[str, Any]:
         """Get a summary of the current order"""
         return self.order_service.get_order_summary()
     
     # Product-related methods
-    def get_filtered_products(self, search_text: str) -> List[str]:
-        """Get products filtered by search text"""
-        return self.product_service.filter_products(search_text)
+    def get_filtered_products(self, search_text: str,
+                              limit: Optional[int] = ProductService.SEARCH_RESULT_LIMIT,
+                              offset: int = 0) -> List[str]:
+        """Get one page of products filtered by search text, best matches first"""
+        return self.product_service.filter_products(search_text, limit, offset)
         
-    def get_product_price(self, product_name: str) -> float:
+    def get_search_stats(self) -> Dict[str, int]:
+        """Get incremental search hit/miss counters"""
+        return self.product_service.get_search_stats()
+
+    def get_product_price(self, product_name: str) -> Money:
         """Get price for a product"""
         return self.product_service.get_product_price(product_name)
         
-    def find_existing_item(self, item_name: str) -> Optional[Any]:
-        """Find an existing item in the order"""
-        return self.order_service.find_item_by_name(item_name)
+    def get_product(self, product_id: int) -> Optional[Product]:
+        """Get a product record from its ID"""
+        return self.product_service.get_product(product_id)
+
+    def find_existing_item(self, product: Product) -> Optional[Any]:
+        """Find the order line a product would be added to"""
+        return self.order_service.find_item_for_product(product.id, product.name)
     
     # validation methods
     def validate_product_quantity(self, value_str):
@@ -94,20 +120,8 @@ class POSController:
         return self.validation_service.validate_product_quantity(value_str)
         
     def validate_payment_input(self, payment_type, value_str):
-      """Validate payment input"""
-      # Temporary direct implementation until validation_service is fully integrated
-      try:
-          if payment_type == PaymentButtonType.CASH_LBP.value and '.' in value_str:
-              return False, "Only whole numbers accepted for LBP"
-              
-          if payment_type == PaymentButtonType.CASH_LBP.value:
-              amount = int(value_str)
-          else:
-              amount = float(value_str)
-              
-          if amount <= 0:
-              return False, "Amount must be greater than zero"
-              
-          return True, None
-      except ValueError:
-          return False, "Invalid amount format"
\ No newline at end of file
+        """Validate payment input"""
+        is_valid, result = self.payment_service.validate_payment(payment_type, value_str)
+        if not is_valid:
+            return False, result
+        return True, None
\ No newline at end of file
@@ -1,25 +1,78 @@
+import os
 import sys
 from PyQt5.QtWidgets import QApplication
 from config.screen_config import screen_config
 import styles
+from services.order_service import OrderService
+from utilities.stall_watchdog import StallWatchdog
+
+# Debug setting: cross-check running order totals against a full recompute
+ENV_VERIFY_TOTALS = 'SNACKSHOP_VERIFY_TOTALS'
+
+def create_app(argv=None, screen_size=None, on_step=None):
+    """Run the application's startup and return (app, window)
+
+    The window is built but not shown. Benchmarks call this to measure
+    the same startup path as a real launch.
+
+    Args:
+        argv: Arguments for QApplication (defaults to sys.argv)
+        screen_size: Optional (width, height) used instead of the
+            detected primary screen
+        on_step: Optional callable run with each step's name right after
+            the step finishes
+    """
+    def step_done(name):
+        if on_step:
+            on_step(name)
 
-def main():
     # Create the application instance
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv if argv is None else argv)
+    step_done('qapplication')
+
+    # Opt-in event loop stall logging (SNACKSHOP_STALL_WATCHDOG=<ms>)
+    watchdog = StallWatchdog.from_environment()
+    if watchdog:
+        watchdog.start()
+    # Kept on the app so it lives as long as the event loop
+    app.stall_watchdog = watchdog
+    step_done('watchdog')
+
+    # Opt-in order totals cross-check (SNACKSHOP_VERIFY_TOTALS=1)
+    if os.environ.get(ENV_VERIFY_TOTALS, '') not in ('', '0'):
+        OrderService.verify_totals_default = True
 
     # Trigger screen configuration early
-    screen_config.get_screen_dimensions()
-    
+    if screen_size:
+        screen_config.set_screen_dimensions(*screen_size)
+    else:
+        screen_config.get_screen_dimensions()
+
     # Initialize styles and layouts
     styles.init_styles(screen_config)
-    
+
+    # State-based button styles are parsed once for the whole application
+    app.setStyleSheet(styles.AppStyles.get_application_stylesheet())
+    step_done('init_styles')
+
+    # Load icons rendered by previous runs in the background
+    from services.icon_service import IconService
+    IconService.get_instance().warm_up()
+    step_done('icon_warm_up')
+
     # Import MainWindow after QApplication exists
     from views.main_window import MainWindow
-    
+    step_done('import_views')
+
     window = MainWindow()
+    step_done('main_window')
+    return app, window
+
+def main():
+    app, window = create_app()
     window.showFullScreen()
 
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,185 @@
+"""
+Money values held in integer minor units.
+
+USD amounts are stored as whole cents and LBP amounts as whole pounds, so
+order arithmetic is plain integer math with no drift. Rounding only
+happens at the edges:
+
+- Parsing a decimal amount (user input, catalog prices) rounds half up to
+  the currency's minor unit.
+- Converting USD to LBP rounds half up to the whole pound, using a
+  conversion table precomputed for the current exchange rate.
+"""
+from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
+from enum import Enum
+from typing import List, Union
+
+
+class Currency(Enum):
+    """Supported currencies and their minor-unit precision"""
+    USD = ('USD', 2, '$')
+    LBP = ('LBP', 0, '')
+
+    def __init__(self, code, decimals, symbol):
+        self.code = code
+        self.decimals = decimals
+        self.symbol = symbol
+        self.minor_per_major = 10 ** decimals
+
+
+class Money:
+    """
+    Immutable amount of money in integer minor units.
+
+    Attributes:
+        amount (int): Amount in minor units (cents for USD, pounds for LBP)
+        currency (Currency): Currency of the amount
+    """
+    __slots__ = ('amount', 'currency')
+
+    def __init__(self, amount: int, currency: Currency = Currency.USD):
+        object.__setattr__(self, 'amount', amount)
+        object.__setattr__(self, 'currency', currency)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Money is immutable")
+
+    @classmethod
+    def usd(cls, cents: int) -> 'Money':
+        """USD amount from whole cents"""
+        return cls(cents, Currency.USD)
+
+    @classmethod
+    def lbp(cls, pounds: int) -> 'Money':
+        """LBP amount from whole pounds"""
+        return cls(pounds, Currency.LBP)
+
+    @classmethod
+    def zero(cls, currency: Currency = Currency.USD) -> 'Money':
+        """Zero amount in a currency"""
+        return cls(0, currency)
+
+    @classmethod
+    def from_major(cls, value: Union[str, int, float, Decimal],
+                   currency: Currency = Currency.USD) -> 'Money':
+        """Amount from a value in major units (e.g. dollars), rounding half up
+
+        Raises:
+            ValueError: If value is not a valid number
+        """
+        try:
+            major = Decimal(str(value))
+        except InvalidOperation:
+            raise ValueError(f"Invalid amount: {value!r}")
+        if not major.is_finite():
+            raise ValueError(f"Invalid amount: {value!r}")
+        minor = (major * currency.minor_per_major).quantize(Decimal('1'), rounding=ROUND_HALF_UP)
+        return cls(int(minor), currency)
+
+    def to_major(self) -> Decimal:
+        """Amount in major units as an exact Decimal"""
+        return Decimal(self.amount).scaleb(-self.currency.decimals)
+
+    def _check_currency(self, other: 'Money') -> None:
+        if not isinstance(other, Money):
+            raise TypeError(f"Expected Money, got {type(other).__name__}")
+        if other.currency is not self.currency:
+            raise ValueError(
+                f"Currency mismatch: {self.currency.code} and {other.currency.code}"
+            )
+
+    def __add__(self, other: 'Money') -> 'Money':
+        self._check_currency(other)
+        return Money(self.amount + other.amount, self.currency)
+
+    def __radd__(self, other) -> 'Money':
+        # Lets sum() start from its default 0
+        if other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other: 'Money') -> 'Money':
+        self._check_currency(other)
+        return Money(self.amount - other.amount, self.currency)
+
+    def __mul__(self, quantity: int) -> 'Money':
+        if not isinstance(quantity, int):
+            raise TypeError("Money can only be multiplied by an integer quantity")
+        return Money(self.amount * quantity, self.currency)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> 'Money':
+        return Money(-self.amount, self.currency)
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, Money) and other.amount == self.amount
+                and other.currency is self.currency)
+
+    def __lt__(self, other: 'Money') -> bool:
+        self._check_currency(other)
+        return self.amount < other.amount
+
+    def __le__(self, other: 'Money') -> bool:
+        self._check_currency(other)
+        return self.amount <= other.amount
+
+    def __gt__(self, other: 'Money') -> bool:
+        self._check_currency(other)
+        return self.amount > other.amount
+
+    def __ge__(self, other: 'Money') -> bool:
+        self._check_currency(other)
+        return self.amount >= other.amount
+
+    def __hash__(self) -> int:
+        return hash((self.amount, self.currency))
+
+    def __bool__(self) -> bool:
+        return self.amount != 0
+
+    def __repr__(self) -> str:
+        return f"Money({self.amount}, Currency.{self.currency.code})"
+
+    def __str__(self) -> str:
+        return self.format()
+
+    def format(self, symbol: bool = True, grouping: bool = True) -> str:
+        """Format for display, e.g. "$1,234.50" or "90,000\""""
+        decimals = self.currency.decimals
+        sign = '-' if self.amount < 0 else ''
+        major, minor = divmod(abs(self.amount), self.currency.minor_per_major)
+        text = f"{major:,}" if grouping else str(major)
+        if decimals:
+            text += f".{minor:0{decimals}d}"
+        prefix = self.currency.symbol if symbol else ''
+        return f"{sign}{prefix}{text}"
+
+
+class ExchangeRate:
+    """
+    USD to LBP conversion with a precomputed table.
+
+    The LBP value of every cent fraction (0-99 cents) is rounded once when
+    the rate is set; converting an amount is then one multiplication for
+    the whole dollars plus a table lookup for the cents.
+    """
+
+    def __init__(self, lbp_per_usd: int):
+        self.lbp_per_usd = lbp_per_usd
+        self._cents_table: List[int] = [
+            (cents * lbp_per_usd * 2 + 100) // 200 for cents in range(100)
+        ]
+
+    def to_lbp(self, usd: Money) -> Money:
+        """Convert a USD amount to whole pounds"""
+        if usd.currency is not Currency.USD:
+            raise ValueError(f"Expected a USD amount, got {usd.currency.code}")
+        dollars, cents = divmod(usd.amount, 100)
+        return Money.lbp(dollars * self.lbp_per_usd + self._cents_table[cents])
+
+    def to_usd(self, lbp: Money) -> Money:
+        """Convert an LBP amount to cents, rounding half up"""
+        if lbp.currency is not Currency.LBP:
+            raise ValueError(f"Expected an LBP amount, got {lbp.currency.code}")
+        return Money.usd((lbp.amount * 200 + self.lbp_per_usd) // (2 * self.lbp_per_usd))
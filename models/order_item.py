@@ -1,9 +1,9 @@
 """
 OrderItem model for managing individual items in a POS order.
 """
-from decimal import Decimal
-from typing import Optional
-from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+from dataclasses import dataclass, field
+from models.money import Money
 
 @dataclass
 class OrderItem:
@@ -12,23 +12,38 @@ class OrderItem:
     
     Attributes:
         name (str): Name of the product
-        price (Decimal): Unit price of the product
+        price (Money): Unit price of the product
         quantity (int): Quantity of items ordered
-        discount (Decimal): Discount amount per unit (default 0)
+        discount (Money): Discount amount per unit (default 0)
         notes (str): Optional notes for the item
+        product_id (int): Catalog ID of the product, if known
     """
     name: str
-    price: Decimal
+    price: Money
     quantity: int = 1
-    discount: Decimal = Decimal('0')
+    discount: Money = field(default_factory=Money.zero)
     notes: Optional[str] = None
+    product_id: Optional[int] = None
+
+    @staticmethod
+    def make_line_key(product_id: Optional[int], name: str,
+                      notes: Optional[str] = None) -> Tuple[Hashable, Optional[str]]:
+        """Build the key identifying an order line: same product and notes merge"""
+        return (product_id if product_id is not None else name, notes or None)
+
+    @property
+    def line_key(self) -> Tuple[Hashable, Optional[str]]:
+        """Key of the order line this item belongs to"""
+        return self.make_line_key(self.product_id, self.name, self.notes)
 
     def __post_init__(self):
-        """Convert price and discount to Decimal if they aren't already"""
-        self.price = Decimal(str(self.price))
-        self.discount = Decimal(str(self.discount))
+        """Convert price and discount to Money if they were given in dollars"""
+        if not isinstance(self.price, Money):
+            self.price = Money.from_major(self.price)
+        if not isinstance(self.discount, Money):
+            self.discount = Money.from_major(self.discount)
 
-    def get_total(self) -> Decimal:
+    def get_total(self) -> Money:
         """Calculate total price for this item including quantity and discounts"""
         return (self.price - self.discount) * self.quantity
 
@@ -44,19 +59,19 @@ class OrderItem:
         """Set the quantity directly, ensuring it's not negative"""
         self.quantity = max(0, quantity)
 
-    def apply_discount(self, amount: Decimal) -> None:
+    def apply_discount(self, amount: Money) -> None:
         """Apply a per-unit discount"""
-        self.discount = Decimal(str(amount))
+        self.discount = amount if isinstance(amount, Money) else Money.from_major(amount)
 
     def clear_discount(self) -> None:
         """Remove any applied discount"""
-        self.discount = Decimal('0')
+        self.discount = Money.zero()
 
-    def get_subtotal(self) -> Decimal:
+    def get_subtotal(self) -> Money:
         """Calculate subtotal before discounts"""
         return self.price * self.quantity
 
-    def get_discount_total(self) -> Decimal:
+    def get_discount_total(self) -> Money:
         """Calculate total discount amount"""
         return self.discount * self.quantity
 
@@ -64,9 +79,10 @@ class OrderItem:
         """Convert the order item to a dictionary representation"""
         return {
             'name': self.name,
-            'price': float(self.price),
+            'price': self.price,
             'quantity': self.quantity,
-            'discount': float(self.discount),
+            'discount': self.discount,
             'notes': self.notes,
-            'total': float(self.get_total())
+            'product_id': self.product_id,
+            'total': self.get_total()
         }
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Product model for catalog entries.
+"""
+import sys
+
+from models.money import Money
+
+
+class Product:
+    """
+    Immutable catalog product.
+
+    Uses __slots__ so large catalogs don't carry a per-instance __dict__,
+    and interns names so repeated display names share one string.
+
+    Attributes:
+        id (int): Stable product ID from the catalog database
+        name (str): Display name of the product
+        price_cents (int): Unit price in cents (0 if the product has no price)
+        category_index (int): Position of the product's category in the catalog
+        flags (int): Bit set of Product.FLAG_* values
+    """
+    __slots__ = ('id', 'name', 'price_cents', 'category_index', 'flags')
+
+    FLAG_PRICED = 0x1
+
+    def __init__(self, product_id: int, name: str, price_cents: int,
+                 category_index: int, flags: int = 0):
+        set_attribute = object.__setattr__
+        set_attribute(self, 'id', product_id)
+        set_attribute(self, 'name', sys.intern(name))
+        set_attribute(self, 'price_cents', price_cents)
+        set_attribute(self, 'category_index', category_index)
+        set_attribute(self, 'flags', flags)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Product is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Product is immutable")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Product) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"Product(id={self.id}, name={self.name!r}, price_cents={self.price_cents})"
+
+    @property
+    def price(self) -> Money:
+        """Unit price as a USD amount"""
+        return Money.usd(self.price_cents)
+
+    @property
+    def is_priced(self) -> bool:
+        """Whether the product has a valid price and can be ordered"""
+        return bool(self.flags & self.FLAG_PRICED)
+
+    def to_dict(self, category: str) -> dict:
+        """Convert the product to a dictionary representation"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'price': self.price,
+            'category': category
+        }
@@ -0,0 +1,194 @@
+"""
+SQLite storage for the product catalog.
+
+The catalog lives in a local database with separate category, product and
+price tables. On first run the database is seeded from the legacy
+definitions in models/product_catalog.py.
+
+Product IDs are stable across imports: a product is identified by its
+category, its name and which occurrence of that name it is within the
+category, so re-importing a catalog updates rows in place instead of
+handing out new IDs.
+"""
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+from models import product_catalog
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'catalog.db'
+)
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS categories (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        position INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS products (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        category_id INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+        occurrence INTEGER NOT NULL DEFAULT 0,
+        position INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS prices (
+        product_id INTEGER PRIMARY KEY REFERENCES products(id) ON DELETE CASCADE,
+        price_cents INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_products_category
+        ON products(category_id, position);
+    CREATE INDEX IF NOT EXISTS idx_products_name
+        ON products(name COLLATE NOCASE);
+"""
+
+# Natural key of a product; created after the occurrence column exists
+SQL_CREATE_PRODUCT_KEY = """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_products_key
+        ON products(category_id, name, occurrence)
+"""
+
+# Databases created before products had an occurrence column
+SQL_ADD_OCCURRENCE = "ALTER TABLE products ADD COLUMN occurrence INTEGER NOT NULL DEFAULT 0"
+SQL_BACKFILL_OCCURRENCE = """
+    UPDATE products SET occurrence = (
+        SELECT COUNT(*) FROM products earlier
+        WHERE earlier.category_id = products.category_id
+          AND earlier.name = products.name
+          AND earlier.position < products.position
+    )
+"""
+
+# Statements are kept as module constants so sqlite3's per-connection
+# statement cache can reuse the prepared form on every call.
+SQL_SELECT_CATEGORIES = "SELECT name FROM categories ORDER BY position"
+
+SQL_SELECT_PRODUCT_RECORDS = """
+    SELECT p.id, p.name, c.name, pr.price_cents
+    FROM products p
+    JOIN categories c ON c.id = p.category_id
+    LEFT JOIN prices pr ON pr.product_id = p.id
+    ORDER BY c.position, p.position
+"""
+
+# Imports upsert on the natural keys so existing rows keep their IDs
+SQL_UPSERT_CATEGORY = """
+    INSERT INTO categories (name, position) VALUES (?, ?)
+    ON CONFLICT (name) DO UPDATE SET position = excluded.position
+"""
+SQL_SELECT_CATEGORY_ID = "SELECT id FROM categories WHERE name = ?"
+SQL_UPSERT_PRODUCT = """
+    INSERT INTO products (name, category_id, occurrence, position) VALUES (?, ?, ?, ?)
+    ON CONFLICT (category_id, name, occurrence) DO UPDATE SET position = excluded.position
+"""
+SQL_SELECT_PRODUCT_ID = """
+    SELECT id FROM products WHERE category_id = ? AND name = ? AND occurrence = ?
+"""
+SQL_UPSERT_PRICE = """
+    INSERT INTO prices (product_id, price_cents) VALUES (?, ?)
+    ON CONFLICT (product_id) DO UPDATE SET price_cents = excluded.price_cents
+"""
+SQL_DELETE_PRICE = "DELETE FROM prices WHERE product_id = ?"
+
+
+class CatalogDatabase:
+    """Thin data-access layer over the SQLite catalog database"""
+
+    STATEMENT_CACHE_SIZE = 64
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self.connection = sqlite3.connect(
+            self.db_path, cached_statements=self.STATEMENT_CACHE_SIZE
+        )
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self._upgrade_schema()
+
+        if self.is_empty():
+            self.seed_from_legacy_catalog()
+
+    def _upgrade_schema(self) -> None:
+        """Add the product natural key to databases created without it"""
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(products)")}
+        with self.connection:
+            if 'occurrence' not in columns:
+                self.connection.execute(SQL_ADD_OCCURRENCE)
+                self.connection.execute(SQL_BACKFILL_OCCURRENCE)
+            self.connection.execute(SQL_CREATE_PRODUCT_KEY)
+
+    def is_empty(self) -> bool:
+        """Check whether the catalog has any categories"""
+        row = self.connection.execute("SELECT 1 FROM categories LIMIT 1").fetchone()
+        return row is None
+
+    def seed_from_legacy_catalog(self) -> None:
+        """Populate the database from models/product_catalog.py"""
+        self.import_catalog(
+            product_catalog.CATEGORIES,
+            product_catalog.PRODUCTS_BY_CATEGORY,
+            product_catalog.PRODUCT_PRICES
+        )
+
+    def import_catalog(self, categories: List[str],
+                       products_by_category: Dict[str, List[str]],
+                       prices: Dict[str, float]) -> None:
+        """Replace the whole catalog in a single transaction
+
+        Products and categories still in the source keep their IDs; rows
+        no longer in the source are deleted.
+        """
+        execute = self.connection.execute
+        with self.connection:
+            execute("CREATE TEMP TABLE IF NOT EXISTS kept_categories (id INTEGER PRIMARY KEY)")
+            execute("CREATE TEMP TABLE IF NOT EXISTS kept_products (id INTEGER PRIMARY KEY)")
+            execute("DELETE FROM kept_categories")
+            execute("DELETE FROM kept_products")
+
+            for category_position, category in enumerate(categories):
+                execute(SQL_UPSERT_CATEGORY, (category, category_position))
+                category_id = execute(SQL_SELECT_CATEGORY_ID, (category,)).fetchone()[0]
+                execute("INSERT OR IGNORE INTO kept_categories VALUES (?)", (category_id,))
+
+                occurrences: Dict[str, int] = {}
+                for position, name in enumerate(products_by_category.get(category, [])):
+                    occurrence = occurrences.get(name, 0)
+                    occurrences[name] = occurrence + 1
+                    key = (category_id, name, occurrence)
+                    execute(SQL_UPSERT_PRODUCT, (name, category_id, occurrence, position))
+                    product_id = execute(SQL_SELECT_PRODUCT_ID, key).fetchone()[0]
+                    execute("INSERT INTO kept_products VALUES (?)", (product_id,))
+
+                    if name in prices:
+                        execute(SQL_UPSERT_PRICE, (product_id, to_cents(prices[name])))
+                    else:
+                        execute(SQL_DELETE_PRICE, (product_id,))
+
+            # Prices go with their products through ON DELETE CASCADE
+            execute("DELETE FROM products WHERE id NOT IN (SELECT id FROM kept_products)")
+            execute("DELETE FROM categories WHERE id NOT IN (SELECT id FROM kept_categories)")
+
+    def fetch_categories(self) -> List[str]:
+        """Get category names in display order"""
+        return [row[0] for row in self.connection.execute(SQL_SELECT_CATEGORIES)]
+
+    def fetch_product_records(self) -> List[Tuple[int, str, str, Optional[int]]]:
+        """Get (product id, name, category, price in cents) rows in catalog order
+
+        Products without a price have None as their price.
+        """
+        return self.connection.execute(SQL_SELECT_PRODUCT_RECORDS).fetchall()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.connection.close()
+
+
+def to_cents(price: float) -> int:
+    """Convert a decimal price to integer cents"""
+    return int(round(price * 100))
+
@@ -0,0 +1,196 @@
+"""
+Icon rasterization cache.
+
+SVG assets are rendered once per (size, device pixel ratio) pair. Rendered
+pixmaps are kept in QPixmapCache for the running session and written as
+PNG files to an on-disk cache so later runs skip the SVG renderer. Every
+rendered variant is recorded in an index, which warm_up() uses at startup
+to load the previous run's icons on a worker thread.
+"""
+import json
+import os
+import threading
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtGui import QGuiApplication, QIcon, QImage, QPainter, QPixmap, QPixmapCache
+from PyQt5.QtSvg import QSvgRenderer
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(PROJECT_ROOT, 'assets', 'images')
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_ROOT, 'data', 'icon_cache')
+
+# (asset name, width, height, device pixel ratio)
+IconVariant = Tuple[str, int, int, float]
+
+
+def _render_image(variant: IconVariant, cache_dir: str) -> Optional[QImage]:
+    """Load a variant from the disk cache, or render and store it
+
+    Only uses QImage, so it is safe to call from worker threads.
+    """
+    name, width, height, ratio = variant
+    source_path = os.path.join(ASSETS_DIR, name)
+    if not os.path.exists(source_path):
+        return None
+
+    cache_path = os.path.join(cache_dir, _cache_file_name(variant))
+    if (os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(source_path)):
+        image = QImage(cache_path)
+        if not image.isNull():
+            return image
+
+    image = QImage(
+        round(width * ratio), round(height * ratio), QImage.Format_ARGB32_Premultiplied
+    )
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    QSvgRenderer(source_path).render(painter)
+    painter.end()
+
+    # Write through a temporary file so a concurrent reader never sees a
+    # partial PNG. The warm-up task and the GUI thread may render the same
+    # variant at once, so the name is unique per thread, not just per process
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        if image.save(temp_path, 'PNG'):
+            os.replace(temp_path, cache_path)
+    except OSError as e:
+        # The rendered image is still usable; only the disk cache missed it
+        print(f"Error caching icon {name}: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    return image
+
+
+def _cache_file_name(variant: IconVariant) -> str:
+    """File name of a variant in the disk cache"""
+    name, width, height, ratio = variant
+    stem = os.path.splitext(name)[0]
+    return f"{stem}_{width}x{height}@{ratio:g}.png"
+
+
+class _WarmUpSignals(QObject):
+    """Signals of the warm-up task (QRunnable is not a QObject)"""
+    image_ready = pyqtSignal(object, QImage)
+
+
+class _WarmUpTask(QRunnable):
+    """Loads or renders a list of icon variants off the GUI thread"""
+
+    def __init__(self, variants: List[IconVariant], cache_dir: str):
+        super().__init__()
+        self.variants = variants
+        self.cache_dir = cache_dir
+        self.signals = _WarmUpSignals()
+
+    def run(self):
+        for variant in self.variants:
+            image = _render_image(variant, self.cache_dir)
+            if image is not None:
+                self.signals.image_ready.emit(variant, image)
+
+
+class IconService:
+    """Central, cached access to the SVG icons in assets/images"""
+
+    _instance = None
+
+    INDEX_FILE = 'index.json'
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(IconService, cls).__new__(cls)
+            cls._instance._initialize(*args, **kwargs)
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls) -> 'IconService':
+        """Get the shared icon service"""
+        return cls()
+
+    def _initialize(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._variants = set(self._load_index())
+        self._warm_up_task = None
+
+    def pixmap(self, name: str, width: int, height: Optional[int] = None,
+               ratio: Optional[float] = None) -> QPixmap:
+        """Get an asset rasterized at a logical size
+
+        Args:
+            name: File name inside assets/images, e.g. "search.svg"
+            width: Logical width in pixels
+            height: Logical height in pixels (defaults to width)
+            ratio: Device pixel ratio (defaults to the application's)
+        """
+        if height is None:
+            height = width
+        if ratio is None:
+            ratio = QGuiApplication.instance().devicePixelRatio()
+        variant = (name, width, height, ratio)
+
+        pixmap = QPixmapCache.find(self._cache_key(variant))
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        image = _render_image(variant, self.cache_dir)
+        if image is None:
+            return QPixmap()
+        pixmap = self._store(variant, image)
+        if variant not in self._variants:
+            self._variants.add(variant)
+            self._save_index()
+        return pixmap
+
+    def icon(self, name: str, size: int, ratio: Optional[float] = None) -> QIcon:
+        """Get an asset as a square QIcon"""
+        return QIcon(self.pixmap(name, size, size, ratio))
+
+    def warm_up(self) -> None:
+        """Load the icons used by previous runs on a worker thread"""
+        if self._warm_up_task is not None or not self._variants:
+            return
+        self._warm_up_task = _WarmUpTask(sorted(self._variants), self.cache_dir)
+        # Queued back to the GUI thread, where pixmaps may be created
+        self._warm_up_task.signals.image_ready.connect(self._on_image_ready)
+        QThreadPool.globalInstance().start(self._warm_up_task)
+
+    def _on_image_ready(self, variant: IconVariant, image: QImage) -> None:
+        """Store an image loaded by the warm-up task"""
+        if QPixmapCache.find(self._cache_key(variant)) is None:
+            self._store(variant, image)
+
+    def _store(self, variant: IconVariant, image: QImage) -> QPixmap:
+        """Convert an image to a pixmap and keep it in the pixmap cache"""
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(variant[3])
+        QPixmapCache.insert(self._cache_key(variant), pixmap)
+        return pixmap
+
+    @staticmethod
+    def _cache_key(variant: IconVariant) -> str:
+        """QPixmapCache key of a variant"""
+        name, width, height, ratio = variant
+        return f"icon:{name}:{width}x{height}@{ratio:g}"
+
+    def _load_index(self) -> List[IconVariant]:
+        """Read the variants rendered by previous runs"""
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE)) as index_file:
+                return [tuple(entry) for entry in json.load(index_file)]
+        except (OSError, ValueError, TypeError):
+            return []
+
+    def _save_index(self) -> None:
+        """Record the rendered variants for the next run's warm-up"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), 'w') as index_file:
+                json.dump(sorted(self._variants), index_file)
+        except OSError as e:
+            print(f"Error saving icon cache index: {e}")
@@ -1,56 +1,123 @@
-from decimal import Decimal
+from enum import Enum
 from models.order_item import OrderItem
-from typing import List, Optional, Dict, Any
+from models.money import Money
+from typing import Callable, Hashable, List, Optional, Dict, Any, Tuple
 from button_definitions.types import OrderButtonType
 
+LineKey = Tuple[Hashable, Optional[str]]
+
+class OrderEvent(Enum):
+    """Kinds of order change reported to listeners"""
+    LINE_ADDED = "line_added"
+    LINE_CHANGED = "line_changed"
+    LINE_REMOVED = "line_removed"
+    CLEARED = "cleared"
+
+OrderListener = Callable[[OrderEvent, Optional[OrderItem]], None]
+
 class OrderService:
-    def __init__(self):
-        self.current_order_items: List[OrderItem] = []
+    # Default for verify_totals; switched on by main.py in debug runs
+    # (SNACKSHOP_VERIFY_TOTALS=1)
+    verify_totals_default = False
+
+    def __init__(self, verify_totals: Optional[bool] = None):
+        # Order lines keyed by OrderItem.line_key, in the order they were added
+        self._lines: Dict[LineKey, OrderItem] = {}
+
+        # Running aggregates, adjusted by delta on every mutation.
+        # With verify_totals they are cross-checked against a full recompute.
+        self.verify_totals = (
+            self.verify_totals_default if verify_totals is None else verify_totals
+        )
+        self._subtotal = Money.zero()
+        self._discount_total = Money.zero()
+        self._item_count = 0
+
+        # Callbacks notified of every change, so views can update only the
+        # affected line
+        self._listeners: List[OrderListener] = []
+
         self.order_id: Optional[str] = None
         self.order_type: str = "TAKE_AWAY"  # Default order type
         self.order_status: str = "NEW"  # Initial status
-        
+
+    @property
+    def current_order_items(self) -> List[OrderItem]:
+        """Items of the current order in the order they were added"""
+        return list(self._lines.values())
+
+    def add_listener(self, listener: OrderListener) -> None:
+        """Register a callback(event, item) for order changes"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: OrderListener) -> None:
+        """Unregister an order change callback"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event: OrderEvent, item: Optional[OrderItem] = None) -> None:
+        """Report a change to all listeners"""
+        for listener in list(self._listeners):
+            listener(event, item)
+
     def create_new_order(self) -> None:
         """Start a fresh order"""
-        self.current_order_items = []
+        self.clear_order()
         # In the future, generate a real order ID
         self.order_id = None
         self.order_status = "NEW"
-        
-    def add_item(self, item_name: str, price: float, quantity: int = 1) -> OrderItem:
-        """Add item to the current order"""
-        # Check if item already exists
-        existing_item = self.find_item_by_name(item_name)
-        
+
+    def add_item(self, item_name: str, price: Money, quantity: int = 1,
+                 product_id: Optional[int] = None, notes: Optional[str] = None) -> OrderItem:
+        """Add item to the current order, merging it into an identical line"""
+        line_key = OrderItem.make_line_key(product_id, item_name, notes)
+        existing_item = self._lines.get(line_key)
+
         if existing_item:
+            self._remove_from_totals(existing_item)
             existing_item.increment_quantity(quantity)
+            self._add_to_totals(existing_item)
+            self._notify(OrderEvent.LINE_CHANGED, existing_item)
             return existing_item
-        
+
         # Create new item
         new_item = OrderItem(
             name=item_name,
-            price=Decimal(str(price)),
-            quantity=quantity
+            price=price,
+            quantity=quantity,
+            notes=notes,
+            product_id=product_id
         )
-        self.current_order_items.append(new_item)
+        self._lines[line_key] = new_item
+        self._add_to_totals(new_item)
+        self._notify(OrderEvent.LINE_ADDED, new_item)
         return new_item
-        
+
     def remove_item(self, item: OrderItem) -> None:
-        """Remove an item from the current order"""
-        if item in self.current_order_items:
-            self.current_order_items.remove(item)
-            
+        """Remove an item's line from the current order"""
+        removed_item = self._lines.pop(item.line_key, None)
+        if removed_item:
+            self._remove_from_totals(removed_item)
+            self._notify(OrderEvent.LINE_REMOVED, removed_item)
+
     def clear_order(self) -> None:
         """Clear all items from the current order"""
-        self.current_order_items = []
-        
-    def find_item_by_name(self, item_name: str) -> Optional[OrderItem]:
-        """Find an item in the order by name"""
-        for item in self.current_order_items:
-            if item.name == item_name:
-                return item
-        return None
-        
+        self._lines.clear()
+        self._subtotal = Money.zero()
+        self._discount_total = Money.zero()
+        self._item_count = 0
+        self._notify(OrderEvent.CLEARED)
+
+    def find_item(self, line_key: LineKey) -> Optional[OrderItem]:
+        """Find an order line by its key"""
+        return self._lines.get(line_key)
+
+    def find_item_for_product(self, product_id: Optional[int], item_name: str,
+                              notes: Optional[str] = None) -> Optional[OrderItem]:
+        """Find the line a product with these notes would be merged into"""
+        return self._lines.get(OrderItem.make_line_key(product_id, item_name, notes))
+
     def set_order_type(self, order_type: str) -> None:
       """Set the type of the current order"""
       # Validate that it's a valid order type
@@ -60,29 +127,83 @@ class OrderService:
       else:
           # Default to TAKE_AWAY if invalid
           self.order_type = OrderButtonType.TAKE_AWAY.value
-        
-    def get_total(self) -> Decimal:
-        """Calculate the total for the current order"""
-        return sum(item.get_total() for item in self.current_order_items)
-        
-    def update_item_quantity(self, item_name: str, final_quantity: int) -> None:
-        """Update an item's quantity or remove if zero"""
-        item = self.find_item_by_name(item_name)
+
+    def get_total(self) -> Money:
+        """Get the total for the current order"""
+        return self.get_totals()['total']
+
+    def get_totals(self) -> Dict[str, Any]:
+        """Snapshot of the running order aggregates"""
+        if self.verify_totals:
+            self._verify_totals()
+        return {
+            'subtotal': self._subtotal,
+            'discount': self._discount_total,
+            'total': self._subtotal - self._discount_total,
+            'item_count': self._item_count,
+            'line_count': len(self._lines)
+        }
+
+    def update_item_quantity(self, line_key: LineKey, final_quantity: int) -> None:
+        """Update a line's quantity or remove it if zero"""
+        item = self._lines.get(line_key)
         if not item:
             return
-            
+
+        self._remove_from_totals(item)
         if final_quantity <= 0:
-            self.remove_item(item)
+            del self._lines[line_key]
+            self._notify(OrderEvent.LINE_REMOVED, item)
         else:
             item.set_quantity(final_quantity)
-            
+            self._add_to_totals(item)
+            self._notify(OrderEvent.LINE_CHANGED, item)
+
+    def apply_item_discount(self, line_key: LineKey, amount: Money) -> None:
+        """Apply a per-unit discount to a line"""
+        item = self._lines.get(line_key)
+        if not item:
+            return
+
+        self._remove_from_totals(item)
+        item.apply_discount(amount)
+        self._add_to_totals(item)
+        self._notify(OrderEvent.LINE_CHANGED, item)
+
+    def _add_to_totals(self, item: OrderItem) -> None:
+        """Add a line's contribution to the running aggregates"""
+        self._subtotal += item.get_subtotal()
+        self._discount_total += item.get_discount_total()
+        self._item_count += item.quantity
+
+    def _remove_from_totals(self, item: OrderItem) -> None:
+        """Take a line's contribution out of the running aggregates"""
+        self._subtotal -= item.get_subtotal()
+        self._discount_total -= item.get_discount_total()
+        self._item_count -= item.quantity
+
+    def _verify_totals(self) -> None:
+        """Check the running aggregates against a full recompute"""
+        items = self._lines.values()
+        expected = (
+            sum((item.get_subtotal() for item in items), Money.zero()),
+            sum((item.get_discount_total() for item in items), Money.zero()),
+            sum(item.quantity for item in items)
+        )
+        actual = (self._subtotal, self._discount_total, self._item_count)
+        if actual != expected:
+            raise AssertionError(
+                f"Order totals out of sync: running {actual}, recomputed {expected}"
+            )
+
     def get_order_summary(self) -> Dict[str, Any]:
         """Return a summary of the current order"""
+        totals = self.get_totals()
         return {
             'order_id': self.order_id,
             'order_type': self.order_type,
             'order_status': self.order_status,
-            'total': float(self.get_total()),
-            'item_count': sum(item.quantity for item in self.current_order_items),
-            'items': [item.to_dict() for item in self.current_order_items]
-        }
\ No newline at end of file
+            'total': totals['total'],
+            'item_count': totals['item_count'],
+            'items': [item.to_dict() for item in self._lines.values()]
+        }
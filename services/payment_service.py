@@ -1,15 +1,20 @@
 from button_definitions.types import PaymentButtonType
-from decimal import Decimal
+from models.money import Money, Currency, ExchangeRate
 from services.validation_service import ValidationService
 
 class PaymentService:
     def __init__(self, exchange_rate=None):
-        self.exchange_rate = exchange_rate or 90000  # Default value
+        self.exchange_rate = exchange_rate or 90000  # LBP per USD, default value
+        self.conversion = ExchangeRate(self.exchange_rate)
         self.validation_service = ValidationService()
         
     def get_exchange_rate(self):
         """Return the current exchange rate"""
         return self.exchange_rate
+
+    def to_lbp(self, amount_usd: Money) -> Money:
+        """Convert a USD amount to LBP at the current rate"""
+        return self.conversion.to_lbp(amount_usd)
     
     def validate_payment(self, payment_type, value_str):
         """Validate payment input based on payment type"""
@@ -22,11 +27,11 @@ class PaymentService:
             if payment_type == PaymentButtonType.CASH_LBP.value:
                 if '.' in value_str:
                     return False, "Only whole numbers accepted for LBP"
-                amount = int(value_str)
+                amount = Money.lbp(int(value_str))
             else:
-                amount = float(value_str)
+                amount = Money.from_major(value_str, Currency.USD)
                 
-            if amount <= 0:
+            if amount.amount <= 0:
                 return False, "Amount must be greater than zero"
                 
             return True, amount
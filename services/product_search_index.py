@@ -0,0 +1,234 @@
+"""
+In-memory n-gram index for product name search.
+
+Every product name is broken into its trigrams. A three-character query is
+answered directly from its posting list; longer queries start from the
+rarest trigram's posting list and only verify those candidates with a
+substring check. One- and two-character queries match a large share of the
+catalog anyway, so they are answered by a scan that is cached per query.
+
+Separate posting lists of 1- to 3-character grams at the start of the name
+and at the start of each word let results be ranked (prefix, word start,
+substring) without re-examining every matching name. Ranked and catalog
+order results are produced lazily, so a limited search stops reading
+posting lists once it has enough entries.
+"""
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+class ProductSearchIndex:
+    """Inverted n-gram index over product names"""
+
+    GRAM_SIZE = 3
+
+    def __init__(self):
+        self._product_ids: List[int] = []
+        self._names: List[str] = []
+        self._lower_names: List[str] = []
+        self._categories: List[str] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._word_start_postings: Dict[str, List[int]] = defaultdict(list)
+        self._prefix_postings: Dict[str, List[int]] = defaultdict(list)
+        self._short_query_cache: Dict[str, List[int]] = {}
+
+    def build(self, entries: Iterable[Tuple[int, str, str]]) -> None:
+        """(Re)build the index from (product id, name, category) rows in catalog order"""
+        self.__init__()
+        for product_id, name, category in entries:
+            self.add(product_id, name, category)
+
+    def add(self, product_id: int, name: str, category: str) -> int:
+        """Index one product and return its entry number"""
+        entry = len(self._names)
+        text = name.lower()
+        self._product_ids.append(product_id)
+        self._names.append(name)
+        self._lower_names.append(text)
+        self._categories.append(category)
+
+        length = len(text)
+        sizes = range(1, self.GRAM_SIZE + 1)
+        grams = {text[i:i + self.GRAM_SIZE] for i in range(length - self.GRAM_SIZE + 1)}
+        word_starts = [0] + [i + 1 for i in range(length - 1) if text[i] == ' ']
+        word_grams = {text[i:i + size] for size in sizes for i in word_starts if i + size <= length}
+
+        for gram in grams:
+            self._postings[gram].append(entry)
+        for gram in word_grams:
+            self._word_start_postings[gram].append(entry)
+        for size in sizes:
+            if size <= length:
+                self._prefix_postings[text[:size]].append(entry)
+        self._short_query_cache.clear()
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(self, search_text: str, category: Optional[str] = None,
+               ranked: bool = True, limit: Optional[int] = None,
+               offset: int = 0) -> List[str]:
+        """Return product names containing search_text (case-insensitive)
+
+        Args:
+            search_text: Text to look for anywhere in the product name
+            category: Only return products from this category
+            ranked: Order by match quality (name prefix, word start, substring)
+                instead of catalog order
+            limit: Maximum number of names to return
+            offset: Number of leading matches to skip, for paging
+        """
+        if ranked:
+            entries = self.search_ranked_entries(search_text, category, limit, offset)
+        else:
+            entries = self.search_page_entries(search_text, category, limit, offset)
+        names = self._names
+        return [names[entry] for entry in entries]
+
+    def search_entries(self, search_text: str, category: Optional[str] = None) -> List[int]:
+        """Return matching entry numbers in catalog order"""
+        query = search_text.lower()
+        if not query:
+            return []
+        return self._filter_category(self._matches(query, self._postings), category)
+
+    def search_page_entries(self, search_text: str, category: Optional[str] = None,
+                            limit: Optional[int] = None, offset: int = 0) -> List[int]:
+        """Return one page of matching entry numbers in catalog order"""
+        query = search_text.lower()
+        if not query:
+            return []
+        entries = self._iter_matches(query, self._postings)
+        if category is not None:
+            categories = self._categories
+            entries = (entry for entry in entries if categories[entry] == category)
+        return list(islice(entries, offset, None if limit is None else offset + limit))
+
+    def search_ranked_entries(self, search_text: str, category: Optional[str] = None,
+                              limit: Optional[int] = None, offset: int = 0) -> List[int]:
+        """Return matching entry numbers ranked by match quality
+
+        Within a tier entries keep catalog order. Tiers are read lazily
+        from their posting lists, so with a limit only about offset + limit
+        entries are examined, however many names match.
+        """
+        query = search_text.lower()
+        if not query:
+            return []
+        ranked = self._iter_ranked(query, category)
+        return list(islice(ranked, offset, None if limit is None else offset + limit))
+
+    def narrow_entries(self, entries: List[int], search_text: str) -> List[int]:
+        """Keep the entries that also match search_text
+
+        Used when a query extends a previous one: its matches are a subset
+        of the previous matches, so only those need to be checked again.
+        """
+        query = search_text.lower()
+        lower_names = self._lower_names
+        return [entry for entry in entries if query in lower_names[entry]]
+
+    def rank_entries(self, entries: List[int], search_text: str,
+                     limit: Optional[int] = None) -> List[int]:
+        """Order already-matched entries by match quality in a single pass"""
+        query = search_text.lower()
+        word_query = ' ' + query
+        lower_names = self._lower_names
+
+        prefix, word_start, substring = [], [], []
+        for entry in entries:
+            name = lower_names[entry]
+            if name.startswith(query):
+                prefix.append(entry)
+            elif word_query in name:
+                word_start.append(entry)
+            else:
+                substring.append(entry)
+
+        ranked = prefix + word_start + substring
+        return ranked[:limit] if limit is not None else ranked
+
+    def get_name(self, entry: int) -> str:
+        """Get the product name of an entry"""
+        return self._names[entry]
+
+    def get_product_id(self, entry: int) -> int:
+        """Get the product ID of an entry"""
+        return self._product_ids[entry]
+
+    def get_category(self, entry: int) -> str:
+        """Get the category of an entry"""
+        return self._categories[entry]
+
+    def _iter_ranked(self, query: str, category: Optional[str]) -> Iterator[int]:
+        """Yield matching entries tier by tier, each entry once"""
+        categories = self._categories
+        seen = set()
+        for postings in (self._prefix_postings, self._word_start_postings, self._postings):
+            for entry in self._iter_matches(query, postings):
+                if entry in seen or (category is not None and categories[entry] != category):
+                    continue
+                seen.add(entry)
+                yield entry
+
+    def _matches(self, query: str, postings: Dict[str, List[int]]) -> List[int]:
+        """Entries matching query at the positions the postings cover"""
+        if postings is self._postings and len(query) < self.GRAM_SIZE:
+            matches = self._short_query_cache.get(query)
+            if matches is None:
+                lower_names = self._lower_names
+                matches = [entry for entry, name in enumerate(lower_names) if query in name]
+                self._short_query_cache[query] = matches
+            return matches
+        if len(query) <= self.GRAM_SIZE:
+            return postings.get(query, [])
+        return list(self._iter_matches(query, postings))
+
+    def _iter_matches(self, query: str, postings: Dict[str, List[int]]) -> Iterator[int]:
+        """Lazily yield entries matching query at the positions the postings cover"""
+        lower_names = self._lower_names
+        if postings is self._postings and len(query) < self.GRAM_SIZE:
+            return iter(self._matches(query, postings))
+
+        if len(query) <= self.GRAM_SIZE:
+            return iter(postings.get(query, []))
+
+        # Start from the most selective list: the query's rarest trigram, or
+        # for the prefix and word start tiers their own leading gram list
+        candidates = self._rarest_posting(query)
+        if postings is not self._postings:
+            leading = postings.get(query[:self.GRAM_SIZE], [])
+            if len(leading) < len(candidates):
+                candidates = leading
+
+        if postings is self._prefix_postings:
+            return (entry for entry in candidates if lower_names[entry].startswith(query))
+
+        if postings is self._word_start_postings:
+            word_query = ' ' + query
+            return (
+                entry for entry in candidates
+                if lower_names[entry].startswith(query) or word_query in lower_names[entry]
+            )
+
+        # Verify trigram candidates with a substring check
+        return (entry for entry in candidates if query in lower_names[entry])
+
+    def _rarest_posting(self, query: str) -> List[int]:
+        """Shortest trigram posting list of a query of at least GRAM_SIZE characters"""
+        candidates = None
+        for start in range(len(query) - self.GRAM_SIZE + 1):
+            posting = self._postings.get(query[start:start + self.GRAM_SIZE])
+            if posting is None:
+                return []
+            if candidates is None or len(posting) < len(candidates):
+                candidates = posting
+        return candidates
+
+    def _filter_category(self, entries: List[int], category: Optional[str]) -> List[int]:
+        """Restrict entries to one category (always returns a new list)"""
+        if category is None:
+            return list(entries)
+        categories = self._categories
+        return [entry for entry in entries if categories[entry] == category]
@@ -1,55 +1,246 @@
-from typing import List, Dict, Any, Optional
-from models.product_catalog import PRODUCT_PRICES, PRODUCTS_BY_CATEGORY, CATEGORIES
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple
+from services.catalog_database import CatalogDatabase
+from services.product_search_index import ProductSearchIndex
+from models.product import Product
+from models.money import Money
 
 class ProductService:
-    def __init__(self):
-        # For now, use the hardcoded product data. Later this will come from a database.
-        self.product_prices = PRODUCT_PRICES
-        self.products_by_category = PRODUCTS_BY_CATEGORY
-        self.categories = CATEGORIES
-        
-    def get_product_price(self, product_name: str) -> float:
+    # Default number of ranked search results; callers page with offset
+    SEARCH_RESULT_LIMIT = 50
+
+    def __init__(self, database: Optional[CatalogDatabase] = None):
+        # Catalog data is stored in SQLite and loaded once into Product
+        # records with lookup maps keyed by product ID
+        self.database = database or CatalogDatabase()
+        self._loaded = False
+        self._categories: List[str] = []
+        self._products: Dict[int, Product] = {}
+        self._ids_by_name: Dict[str, List[int]] = {}
+        self._ids_by_category: Dict[str, List[int]] = {}
+        self._names_by_category: Dict[str, List[str]] = {}
+        self._search_index: Optional[ProductSearchIndex] = None
+
+        # Callbacks told which categories changed when the catalog is replaced
+        self._catalog_listeners: List[Callable[[Set[str]], None]] = []
+
+        # Last search query and its matches, reused while the query is extended
+        self._last_search_query: Optional[str] = None
+        self._last_search_entries: List[int] = []
+        self.search_hits = 0
+        self.search_misses = 0
+
+    def _ensure_loaded(self) -> None:
+        """Load every product record once and build the reverse maps"""
+        if self._loaded:
+            return
+
+        self._categories = self.database.fetch_categories()
+        self._ids_by_category = {category: [] for category in self._categories}
+
+        category_indexes = {category: i for i, category in enumerate(self._categories)}
+        for product_id, name, category, price_cents in self.database.fetch_product_records():
+            flags = Product.FLAG_PRICED if price_cents and price_cents > 0 else 0
+            product = Product(
+                product_id, name, price_cents or 0, category_indexes[category], flags
+            )
+            self._products[product_id] = product
+            self._ids_by_name.setdefault(product.name, []).append(product_id)
+            self._ids_by_category[category].append(product_id)
+
+        self._loaded = True
+
+    def get_product_price(self, product_name: str) -> Money:
         """Get price for a specific product"""
-        return self.product_prices.get(product_name, 0.0)
-        
+        product_ids = self.get_product_ids_by_name(product_name)
+        if not product_ids:
+            return Money.zero()
+        return self._products[product_ids[0]].price
+
     def get_products_for_category(self, category_name: str) -> List[str]:
         """Get all products for a specific category"""
-        return self.products_by_category.get(category_name, [])
-        
+        names = self._names_by_category.get(category_name)
+        if names is None:
+            names = [
+                self._products[product_id].name
+                for product_id in self.get_product_ids_for_category(category_name)
+            ]
+            self._names_by_category[category_name] = names
+        return names
+
     def get_all_categories(self) -> List[str]:
         """Get list of all product categories"""
-        return self.categories
-        
-    def filter_products(self, search_text: str) -> List[str]:
-        """Filter products based on search text"""
-        if not search_text:
-            return []
-            
-        search_text = search_text.lower()
-        filtered_products = []
-        
-        # Search across all categories
-        for category in self.categories:
-            for product in self.products_by_category.get(category, []):
-                if search_text in product.lower():
-                    filtered_products.append(product)
-                    
-        return filtered_products
-        
+        self._ensure_loaded()
+        return self._categories
+
     def get_product_details(self, product_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a product"""
-        if product_name not in self.product_prices:
+        product_ids = self.get_product_ids_by_name(product_name)
+        if not product_ids:
+            return None
+        product = self._products[product_ids[0]]
+        if not product.is_priced:
             return None
-            
-        # Find which category this product belongs to
-        category = None
-        for cat, products in self.products_by_category.items():
-            if product_name in products:
-                category = cat
-                break
-                
+        return product.to_dict(self._categories[product.category_index])
+
+    def get_product(self, product_id: int) -> Optional[Product]:
+        """Get a product record by its ID"""
+        self._ensure_loaded()
+        return self._products.get(product_id)
+
+    def get_product_category(self, product: Product) -> str:
+        """Get the category a product belongs to"""
+        self._ensure_loaded()
+        return self._categories[product.category_index]
+
+    def get_product_ids_by_name(self, product_name: str) -> List[int]:
+        """Get the IDs of all products with this display name"""
+        self._ensure_loaded()
+        return self._ids_by_name.get(product_name, [])
+
+    def get_product_ids_for_category(self, category_name: str) -> List[int]:
+        """Get a category's product IDs in display order"""
+        self._ensure_loaded()
+        return self._ids_by_category.get(category_name, [])
+
+    def filter_products(self, search_text: str, limit: Optional[int] = SEARCH_RESULT_LIMIT,
+                        offset: int = 0) -> List[str]:
+        """Filter products based on search text, best matches first
+
+        With a limit, one page of matches is ranked straight from the
+        index's posting lists, without collecting every match. With
+        limit=None, the full result set is narrowed from the previous
+        query when possible and then ranked.
+        """
+        if not search_text:
+            return []
+
+        index = self.get_search_index()
+        if limit is not None:
+            return index.search(search_text, limit=limit, offset=offset)
+        entries = index.rank_entries(self._find_matching_entries(search_text), search_text)
+        return [index.get_name(entry) for entry in entries[offset:]]
+
+    def filter_category_products(self, category_name: str, search_text: str) -> List[str]:
+        """Filter one category's products, keeping their display order"""
+        if not search_text:
+            return self.get_products_for_category(category_name)
+        return [
+            self._products[product_id].name
+            for product_id in self.filter_category_product_ids(category_name, search_text)
+        ]
+
+    def filter_category_product_ids(self, category_name: str, search_text: str,
+                                    limit: Optional[int] = None,
+                                    offset: int = 0) -> List[int]:
+        """Filter one category's product IDs, keeping their display order
+
+        With a limit, only one page of matches is read from the index.
+        """
+        if not search_text:
+            ids = self.get_product_ids_for_category(category_name)
+            return ids[offset:] if limit is None else ids[offset:offset + limit]
+
+        index = self.get_search_index()
+        if limit is not None:
+            entries = index.search_page_entries(search_text, category_name, limit, offset)
+            return [index.get_product_id(entry) for entry in entries]
+        return [
+            index.get_product_id(entry) for entry in self._find_matching_entries(search_text)
+            if index.get_category(entry) == category_name
+        ]
+
+    def _find_matching_entries(self, search_text: str) -> List[int]:
+        """Get index entries matching search_text, narrowing the last result when possible
+
+        If the new query contains the previous one (e.g. "chi" after "ch"),
+        its matches are a subset of the previous matches and only those are
+        re-checked. Anything else (backspace, edits in the middle) falls
+        back to a full index search.
+        """
+        query = search_text.lower()
+        index = self.get_search_index()
+        last_query = self._last_search_query
+
+        if last_query is not None and last_query in query:
+            self.search_hits += 1
+            if query != last_query:
+                self._last_search_entries = index.narrow_entries(self._last_search_entries, query)
+        else:
+            self.search_misses += 1
+            self._last_search_entries = index.search_entries(query)
+
+        self._last_search_query = query
+        return self._last_search_entries
+
+    def get_search_stats(self) -> Dict[str, int]:
+        """Get incremental search reuse counters"""
+        return {
+            'hits': self.search_hits,
+            'misses': self.search_misses
+        }
+
+    def reset_search_stats(self) -> None:
+        """Reset incremental search reuse counters"""
+        self.search_hits = 0
+        self.search_misses = 0
+
+    def get_search_index(self) -> ProductSearchIndex:
+        """Get the product name index, building it on first use"""
+        if self._search_index is None:
+            self._ensure_loaded()
+            self._search_index = ProductSearchIndex()
+            categories = self._categories
+            self._search_index.build(
+                (product.id, product.name, categories[product.category_index])
+                for product in self._products.values()
+            )
+        return self._search_index
+
+    def import_catalog(self, categories: List[str],
+                       products_by_category: Dict[str, List[str]],
+                       prices: Dict[str, float]) -> None:
+        """Replace the stored catalog, drop cached reads and notify listeners"""
+        old_contents = self._category_contents()
+        self.database.import_catalog(categories, products_by_category, prices)
+        self.invalidate_cache()
+
+        new_contents = self._category_contents()
+        changed_categories = {
+            category for category in old_contents.keys() | new_contents.keys()
+            if old_contents.get(category) != new_contents.get(category)
+        }
+        for listener in list(self._catalog_listeners):
+            listener(changed_categories)
+
+    def add_catalog_listener(self, listener: Callable[[Set[str]], None]) -> None:
+        """Register a callback(changed_categories) for catalog imports"""
+        if listener not in self._catalog_listeners:
+            self._catalog_listeners.append(listener)
+
+    def remove_catalog_listener(self, listener: Callable[[Set[str]], None]) -> None:
+        """Unregister a catalog import callback"""
+        if listener in self._catalog_listeners:
+            self._catalog_listeners.remove(listener)
+
+    def _category_contents(self) -> Dict[str, List[Tuple[str, int]]]:
+        """Displayed (name, price) rows per category, used to detect changes"""
+        self._ensure_loaded()
         return {
-            'name': product_name,
-            'price': self.product_prices.get(product_name, 0.0),
-            'category': category
-        }
\ No newline at end of file
+            category: [
+                (self._products[product_id].name, self._products[product_id].price_cents)
+                for product_id in product_ids
+            ]
+            for category, product_ids in self._ids_by_category.items()
+        }
+
+    def invalidate_cache(self) -> None:
+        """Clear the in-process lookup maps after the catalog changes"""
+        self._loaded = False
+        self._categories = []
+        self._products.clear()
+        self._ids_by_name.clear()
+        self._ids_by_category.clear()
+        self._names_by_category.clear()
+        self._search_index = None
+        self._last_search_query = None
+        self._last_search_entries = []
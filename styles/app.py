@@ -1,3 +1,6 @@
+from .buttons import ButtonStyles
+from .grid_widgets import GridWidgetStyles
+
 class AppStyles:
     """Application-wide styles"""
     WINDOW_MAIN = """
@@ -10,4 +13,56 @@ class AppStyles:
         QLabel {
             qproperty-alignment: AlignCenter;
         }
-    """
\ No newline at end of file
+    """
+
+    # Selectors for buttons styled by the application stylesheet; widgets
+    # opt in by setting their 'button_role' property
+    PRODUCT_BUTTON = 'QPushButton[button_role="product"]'
+    CATEGORY_BUTTON = 'QPushButton[button_role="category"]'
+    ORDER_TYPE_BUTTON = 'QPushButton[button_role="order_type"]'
+
+    # Compiled application stylesheets, by size category
+    _compiled_stylesheets = {}
+
+    @classmethod
+    def get_application_stylesheet(cls):
+        """Get the application stylesheet, compiled once per size category
+
+        Selected and numpad-locked states are matched through the
+        'selected' and 'disabled_by_numpad' properties, which widgets
+        switch with ButtonStyles.set_state instead of replacing their
+        stylesheet.
+        """
+        if not ButtonStyles.layout_config:
+            return ""
+
+        size_category = ButtonStyles.layout_config.screen_config.get_size_category()
+        stylesheet = cls._compiled_stylesheets.get(size_category)
+        if stylesheet is None:
+            stylesheet = cls._compile_stylesheet()
+            cls._compiled_stylesheets[size_category] = stylesheet
+        return stylesheet
+
+    @classmethod
+    def _compile_stylesheet(cls):
+        """Build the application stylesheet from the button style generators"""
+        return "".join([
+            GridWidgetStyles.get_disabled_product_button_style(
+                ButtonStyles.get_product_button_style(cls.PRODUCT_BUTTON)
+            ),
+            ButtonStyles.get_category_button_style(False, cls.CATEGORY_BUTTON),
+            ButtonStyles.get_category_button_style(
+                True, cls.CATEGORY_BUTTON + '[selected="true"]'
+            ),
+            cls.get_order_type_button_rules(),
+        ])
+
+    @classmethod
+    def get_order_type_button_rules(cls):
+        """Normal and selected order type button rules"""
+        return "".join([
+            ButtonStyles.get_order_button_style(False, cls.ORDER_TYPE_BUTTON),
+            ButtonStyles.get_order_button_style(
+                True, cls.ORDER_TYPE_BUTTON + '[selected="true"]'
+            ),
+        ])
@@ -81,7 +81,7 @@ class ButtonStyles:
         """
 
     @classmethod
-    def get_order_button_style(cls, is_selected=False):
+    def get_order_button_style(cls, is_selected=False, selector="QPushButton"):
         """Generate order type button style based on selection state"""
         if not cls._check_config():
             return ""
@@ -91,7 +91,7 @@ class ButtonStyles:
         
         if is_selected:
             return f"""
-                QPushButton {{
+                {selector} {{
                     background: {config['selected_background']};
                     border: none;
                     border-radius: {button_config['border_radius']}px;
@@ -104,7 +104,7 @@ class ButtonStyles:
             """
         else:
             return f"""
-                QPushButton {{
+                {selector} {{
                     background: {config['background']};
                     border: 1px solid {config['border_color']};
                     border-radius: {button_config['border_radius']}px;
@@ -116,7 +116,7 @@ class ButtonStyles:
             """
 
     @classmethod
-    def get_category_button_style(cls, is_selected=False):
+    def get_category_button_style(cls, is_selected=False, selector="QPushButton"):
         """Generate category button style without size properties"""
         if not cls._check_config():
             return ""
@@ -126,7 +126,7 @@ class ButtonStyles:
         
         if is_selected:
             return f"""
-                QPushButton {{
+                {selector} {{
                     background: {config['selected_background']};
                     border: none;
                     border-radius: {grid_config['category_button']['radius']}px;
@@ -138,7 +138,7 @@ class ButtonStyles:
             """
         else:
             return f"""
-                QPushButton {{
+                {selector} {{
                     background: {config['background']};
                     border: 1px solid {config['border_color']};
                     border-radius: {grid_config['category_button']['radius']}px;
@@ -149,7 +149,7 @@ class ButtonStyles:
             """
 
     @classmethod
-    def get_product_button_style(cls):
+    def get_product_button_style(cls, selector="QPushButton"):
         """Generate product button style without size properties"""
         if not cls._check_config():
             return ""
@@ -158,7 +158,7 @@ class ButtonStyles:
         grid_config = cls.layout_config.get_product_grid_config()
         
         return f"""
-            QPushButton {{
+            {selector} {{
                 background: {config['background']};
                 border: 1px solid {config['border_color']};
                 border-radius: {grid_config['product_button']['radius']}px;
@@ -167,15 +167,28 @@ class ButtonStyles:
                 font-weight: {config['font_weight']};
                 font-size: {grid_config['product_button']['font_size']}px;
             }}
-            QPushButton:hover {{
+            {selector}:hover {{
                 background: {config['background_hover']};
                 border-color: {config['border_color_hover']};
             }}
-            QPushButton:pressed {{
+            {selector}:pressed {{
                 background: {config['background_pressed']};
             }}
         """
     
+    @staticmethod
+    def set_state(widget, name, value):
+        """Switch a state property used by the application stylesheet
+
+        Only the widget is re-polished; no stylesheet is parsed.
+        """
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        widget.update()
+
     @classmethod
     def _check_config(cls):
         """Common configuration check
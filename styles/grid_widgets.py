@@ -42,6 +42,33 @@ class GridWidgetStyles:
         }
     """
     
+    # Virtualized product grid style
+    VIRTUAL_GRID = """
+        QAbstractScrollArea {
+            border: none;
+            background: transparent;
+        }
+        QAbstractScrollArea > QWidget {
+            background: transparent;
+        }
+        QScrollBar:vertical {
+            border: none;
+            background: #F8F9FA;
+            width: 8px;
+            margin: 0;
+        }
+        QScrollBar::handle:vertical {
+            background: #DEDEDE;
+            border-radius: 4px;
+            min-height: 20px;
+        }
+        QScrollBar::add-line:vertical, 
+        QScrollBar::sub-line:vertical {
+            border: none;
+            background: none;
+        }
+    """
+    
     @staticmethod
     def get_disabled_product_button_style(base_style):
         """Get style for disabled product buttons
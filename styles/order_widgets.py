@@ -66,6 +66,41 @@ class OrderWidgetStyles:
             }
         """
     
+    @staticmethod
+    def get_order_item_colors():
+        """Get colors used when painting order item rows"""
+        return {
+            'background': '#FFFFFF',
+            'text': '#333333',
+            'selected_background': '#E3F2FD',
+            'selected_border': '#2196F3',
+            'selected_border_radius': 4
+        }
+
+    @staticmethod
+    def get_order_list_view_style():
+        """Get order list view style"""
+        return """
+            QListView {
+                border: none;
+                background: white;
+                outline: none;
+            }
+            QScrollBar:vertical {
+                border: none;
+                background: #F8F9FA;
+                margin: 0;
+            }
+            QScrollBar::handle:vertical {
+                background: #DEDEDE;
+            }
+            QScrollBar::add-line:vertical, 
+            QScrollBar::sub-line:vertical {
+                border: none;
+                background: none;
+            }
+        """
+    
     # Quantity summary style
     @staticmethod
     def get_quantity_summary_style():
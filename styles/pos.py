@@ -1,3 +1,5 @@
+from .app import AppStyles
+
 class POSStyles:
     """POS view specific styles"""
     screen_config = None
@@ -74,9 +76,14 @@ class POSStyles:
     
     @classmethod
     def ORDER_TYPE_CONTAINER(cls):
-        """Style for the container holding order type buttons"""
+        """Style for the container holding order type buttons
+
+        Scoped by object name: an ancestor's stylesheet beats the
+        application stylesheet, so a bare QWidget rule would hide the
+        buttons' selected state.
+        """
         return """
-            QWidget {
+            QWidget#orderTypeContainer {
                 background: white;
                 border-bottom: 1px solid #DEDEDE;
             }
@@ -84,9 +91,14 @@ class POSStyles:
     
     @classmethod
     def CATEGORY_CONTAINER(cls):
-        """Style for the container holding category buttons"""
+        """Style for the container holding category buttons
+
+        Scoped by object name: an ancestor's stylesheet beats the
+        application stylesheet, so a bare QWidget rule would hide the
+        buttons' selected state.
+        """
         return """
-            QWidget {
+            QWidget#categoryContainer {
                 background: white;
                 border-bottom: 1px solid #DEDEDE;
             }
@@ -124,12 +136,16 @@ class POSStyles:
 
     @classmethod
     def LEFT_CONTAINER(cls):
-        """Style for the left container holding order type and order list"""
+        """Style for the left container holding order type and order list
+
+        The white background reaches every child, so the order type button
+        rules are repeated here, where their higher specificity wins.
+        """
         return """
             QWidget {
                 background: white;
             }
-        """
+        """ + AppStyles.get_order_type_button_rules()
 
     @classmethod
     def PAYMENT_CONTAINER(cls):
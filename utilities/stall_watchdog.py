@@ -0,0 +1,156 @@
+"""
+Opt-in watchdog for Qt event loop stalls.
+
+A QTimer on the GUI thread beats at a fixed interval. Every beat re-arms
+faulthandler.dump_traceback_later for the stall threshold, so when the
+event loop stops beating for longer than the threshold, faulthandler's C
+watchdog thread writes the stacks of all Python threads to the log file.
+It does not need the GIL, so it reports on time even while C++ code
+holds it. The next beat measures how long the loop was blocked and hands
+the stall to a background thread, which logs its number and duration.
+A per-session summary is logged when the application quits.
+
+Enable it by setting SNACKSHOP_STALL_WATCHDOG to the stall threshold in
+milliseconds (e.g. SNACKSHOP_STALL_WATCHDOG=1000). SNACKSHOP_STALL_LOG
+overrides the log file path.
+"""
+import faulthandler
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from typing import Optional
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+
+ENV_THRESHOLD = 'SNACKSHOP_STALL_WATCHDOG'
+ENV_LOG_PATH = 'SNACKSHOP_STALL_LOG'
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_LOG_PATH = os.path.join(PROJECT_ROOT, 'data', 'logs', 'stalls.log')
+
+
+class StallWatchdog:
+    """Detects and logs event loop stalls longer than a threshold"""
+
+    DEFAULT_THRESHOLD_MS = 1000
+    HEARTBEAT_INTERVAL_MS = 100
+
+    # Rotating log: 1 MB per file, 5 old files kept
+    LOG_MAX_BYTES = 1024 * 1024
+    LOG_BACKUP_COUNT = 5
+
+    def __init__(self, threshold_ms: int = DEFAULT_THRESHOLD_MS,
+                 log_path: str = DEFAULT_LOG_PATH):
+        self.threshold = threshold_ms / 1000
+        self.log_path = log_path
+        self.stall_count = 0
+        self.longest_stall = 0.0
+
+        self._last_beat = time.monotonic()
+        # Stall durations measured on the GUI thread, logged by the thread
+        self._stalls = queue.Queue()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._heartbeat_timer = None
+        self.logger = self._create_logger()
+
+    @classmethod
+    def from_environment(cls) -> Optional['StallWatchdog']:
+        """Create a watchdog if SNACKSHOP_STALL_WATCHDOG is set, else None"""
+        value = os.environ.get(ENV_THRESHOLD)
+        if not value:
+            return None
+        try:
+            threshold_ms = int(value)
+        except ValueError:
+            threshold_ms = cls.DEFAULT_THRESHOLD_MS
+        if threshold_ms <= 0:
+            threshold_ms = cls.DEFAULT_THRESHOLD_MS
+        return cls(threshold_ms, os.environ.get(ENV_LOG_PATH) or DEFAULT_LOG_PATH)
+
+    def _create_logger(self) -> logging.Logger:
+        """Logger writing to this watchdog's rotating log file"""
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            self.log_path, maxBytes=self.LOG_MAX_BYTES, backupCount=self.LOG_BACKUP_COUNT
+        )
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+        # faulthandler writes its stack dumps to the same file
+        self._handler = handler
+
+        logger = logging.getLogger(f'snackshop.stall_watchdog.{id(self)}')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        return logger
+
+    def start(self) -> None:
+        """Start heartbeating; must be called on the GUI thread"""
+        if self._thread is not None:
+            return
+        self._last_beat = time.monotonic()
+        self._arm_dump()
+
+        self._heartbeat_timer = QTimer()
+        self._heartbeat_timer.timeout.connect(self._beat)
+        self._heartbeat_timer.start(self.HEARTBEAT_INTERVAL_MS)
+        QApplication.instance().aboutToQuit.connect(self.stop)
+
+        self._thread = threading.Thread(
+            target=self._watch, name='StallWatchdog', daemon=True
+        )
+        self._thread.start()
+        self.logger.info(
+            "Session started (pid %d), stall threshold %d ms",
+            os.getpid(), self.threshold * 1000
+        )
+
+    def stop(self) -> None:
+        """Stop watching and log the session summary"""
+        if self._thread is None:
+            return
+        faulthandler.cancel_dump_traceback_later()
+        self._heartbeat_timer.stop()
+        self._stop_event.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        self.logger.info(
+            "Session summary: %d stalls, longest %.0f ms",
+            self.stall_count, self.longest_stall * 1000
+        )
+
+    def _arm_dump(self) -> None:
+        """(Re)start faulthandler's countdown to a stack dump"""
+        # The handler's stream changes when the log rotates
+        self._handler.flush()
+        faulthandler.dump_traceback_later(
+            self.threshold, repeat=False, file=self._handler.stream
+        )
+
+    def _beat(self) -> None:
+        """Record that the event loop is running (GUI thread)"""
+        now = time.monotonic()
+        self._arm_dump()
+        blocked_for = now - self._last_beat
+        self._last_beat = now
+        if blocked_for > self.threshold:
+            self.stall_count += 1
+            self.longest_stall = max(self.longest_stall, blocked_for)
+            self._stalls.put((self.stall_count, blocked_for))
+
+    def _watch(self) -> None:
+        """Log stalls reported by the heartbeat until stopped (watchdog thread)"""
+        while True:
+            try:
+                number, blocked_for = self._stalls.get(timeout=0.5)
+            except queue.Empty:
+                if self._stop_event.is_set():
+                    return
+                continue
+            self.logger.warning(
+                "Event loop stall #%d ended after %.0f ms", number, blocked_for * 1000
+            )
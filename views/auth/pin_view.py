@@ -229,6 +229,12 @@ class PinView(QWidget):
         for btn in self.number_buttons:
             btn.setEnabled(not is_complete)
 
+    def reset(self, user_id):
+        """Prepare the view for a new PIN entry, reusing its widgets"""
+        self.user_id = user_id
+        self._reset_pin_label()
+        self.pin_input.clear_all()
+
     def _handle_cancel(self):
         """Handle Cancel button click"""
         # Reset the label and input before going cancel
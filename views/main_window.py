@@ -1,4 +1,4 @@
-from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout
+from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget
 from components.auth import AuthTopBar, AuthenticationContainer
 from .view_manager import ViewManager
 from styles.app import AppStyles 
@@ -37,14 +37,19 @@ class MainWindow(QMainWindow):
         self._setup_ui()
 
     def _setup_ui(self):
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+        # The auth screen and the users' POS views are pages of one stack,
+        # created once and switched between on lock/unlock
+        self.central_stack = QStackedWidget()
+        self.setCentralWidget(self.central_stack)
         self.centralWidget().setContentsMargins(0, 0, 0, 0)
-        main_layout = QVBoxLayout(central_widget)
+
+        self.auth_page = QWidget()
+        self.central_stack.addWidget(self.auth_page)
+        main_layout = QVBoxLayout(self.auth_page)
         main_layout.setContentsMargins(20, 20, 20, 20)
         
         # Add auth top bar
-        auth_top_bar = AuthTopBar(central_widget)
+        auth_top_bar = AuthTopBar(self.auth_page)
         main_layout.addWidget(auth_top_bar)
         
         # Add vertical spacer to push content down
@@ -2,14 +2,13 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QFrame, QSplitter, QMessageBox)
 from PyQt5.QtCore import Qt, QSize, QTimer, QDateTime
 from PyQt5.QtGui import QFont
-from PyQt5.QtSvg import QSvgRenderer
 
 from styles import POSStyles
 from styles.order_widgets import OrderWidgetStyles
 from styles.layouts import layout_config
 from config.layouts.order_list_layout import order_layout_config
 
-from components.common import TopBarWidget
+from components.common import TopBarWidget, LazyWidget
 from components.pos.order_list_widget import OrderListWidget
 from components.pos.product_grid_widget import ProductGridWidget
 from components.pos.totals_widget import TotalsWidget
@@ -17,7 +16,7 @@ from components.pos.totals_widget import TotalsWidget
 
 from components.pos.order_type_widget import OrderTypeWidget
 from components.pos.transaction_buttons_widget import TransactionButtonsWidget
-from components.keyboard import VirtualKeyboard
+from components.keyboard import VirtualKeyboard, KeyboardManager
 from components.numpad import NumpadWidget
 from components.pos.usd_preset_widget import USDPresetWidget
 from components.pos.lbp_preset_widget import LBPPresetWidget
@@ -27,13 +26,17 @@ from components.pos.cash_usd_payment_widget import CashUSDPaymentWidget
 from components.pos.cash_lbp_payment_widget import CashLBPPaymentWidget 
 
 from controllers.pos_controller import POSController
+from services.order_service import OrderEvent
 
 
 class POSView(QWidget):
     # Define constants
     BUTTON_PROTECTION_TIMEOUT_MS = 500
+    # Delay before and between idle-time builds of deferred widgets, so
+    # taps are handled between builds
+    DEFERRED_BUILD_INTERVAL_MS = 50
 
-    def __init__(self, user_id, user_name, parent=None):
+    def __init__(self, user_id, user_name, parent=None, controller=None):
         super().__init__(parent)
         self.user_id = user_id
         self.user_name = user_name
@@ -42,12 +45,19 @@ class POSView(QWidget):
         self.current_currency_mode = None  # Tracks which currency type is active
 
          # Create controller 
-        self.controller = POSController()
+        self.controller = controller or POSController()
         
         # Get exchange rate from controller
         self.exchange_rate = self.controller.get_exchange_rate()
 
-        self.keyboard = VirtualKeyboard(self)
+        # Built on first use or at idle time after the first paint
+        self._keyboard = None
+        KeyboardManager().register_keyboard_factory(lambda: self.keyboard)
+        self._deferred_builds = []
+        self._deferred_build_timer = QTimer(self)
+        self._deferred_build_timer.setSingleShot(True)
+        self._deferred_build_timer.setInterval(self.DEFERRED_BUILD_INTERVAL_MS)
+        self._deferred_build_timer.timeout.connect(self._build_next_deferred)
         self.pending_quantity = None  # Track pending quantity from numpad
         self.pending_value = None  # Track pending value from numpad
 
@@ -59,6 +69,56 @@ class POSView(QWidget):
 
         self._setup_ui()
 
+    @property
+    def keyboard(self):
+        """The view's virtual keyboard, built on first use"""
+        if self._keyboard is None:
+            self._keyboard = VirtualKeyboard(self)
+        return self._keyboard
+
+    # Widgets behind LazyWidget placeholders, built on first access
+    @property
+    def numpad_widget(self):
+        return self.numpad_slot.widget()
+
+    @property
+    def usd_preset_widget(self):
+        return self.usd_preset_slot.widget()
+
+    @property
+    def lbp_preset_widget(self):
+        return self.lbp_preset_slot.widget()
+
+    @property
+    def cash_usd_widget(self):
+        return self.cash_usd_slot.widget()
+
+    @property
+    def cash_lbp_widget(self):
+        return self.cash_lbp_slot.widget()
+
+    @property
+    def card_payment_widget(self):
+        return self.card_payment_slot.widget()
+
+    @property
+    def other_payment_widget(self):
+        return self.other_payment_slot.widget()
+
+    def showEvent(self, event):
+        """Start building deferred widgets once the view is on screen"""
+        super().showEvent(event)
+        if self._deferred_builds and not self._deferred_build_timer.isActive():
+            self._deferred_build_timer.start()
+
+    def _build_next_deferred(self):
+        """Build one deferred widget per timer tick so input stays responsive"""
+        if not self._deferred_builds:
+            return
+        self._deferred_builds.pop(0)()
+        if self._deferred_builds:
+            self._deferred_build_timer.start()
+
     def _setup_ui(self):
         """Initialize the main UI structure"""
         main_layout = QVBoxLayout(self)
@@ -98,7 +158,7 @@ class POSView(QWidget):
         )
         
         # Left Side - Order Details
-        self.order_list = OrderListWidget()
+        self.order_list = OrderListWidget(order_totals=self.controller.get_order_totals)
         self.order_widget = self.order_list
         inner_splitter.addWidget(self.order_widget)
         
@@ -119,6 +179,7 @@ class POSView(QWidget):
 
         # Create order type container with fixed height
         order_type_container = QWidget()
+        order_type_container.setObjectName('orderTypeContainer')
         order_type_container.setStyleSheet(POSStyles.ORDER_TYPE_CONTAINER())
         order_type_container.setFixedHeight(
             self.layout_config.get_pos_layout()['order_type_container_height']
@@ -200,7 +261,7 @@ class POSView(QWidget):
         main_layout.setSpacing(0)
 
         # Create product grid FIRST
-        self.product_grid = ProductGridWidget()
+        self.product_grid = ProductGridWidget(self.controller.product_service)
 
         # Then create the category container using the existing product grid
         category_container = self._create_category_container()
@@ -218,6 +279,7 @@ class POSView(QWidget):
     def _create_category_container(self):
         """Create container for category buttons"""
         category_container = QWidget()
+        category_container.setObjectName('categoryContainer')
         category_container.setStyleSheet(POSStyles.CATEGORY_CONTAINER())
         category_container.setFixedHeight(
             self.layout_config.get_pos_layout()['category_container_height']
@@ -246,17 +308,18 @@ class POSView(QWidget):
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
 
-        # Add numpad
-        self.numpad_widget = NumpadWidget(self)
-        layout.addWidget(self.numpad_widget)
+        # Numpad, presets and payment options are not needed for the first
+        # interaction; placeholders hold their place until they are built
+        self.numpad_slot = LazyWidget(lambda: NumpadWidget(self), self._connect_numpad)
+        layout.addWidget(self.numpad_slot)
         
-        # Create USD Preset Widget 
-        self.usd_preset_widget = USDPresetWidget()
-        layout.addWidget(self.usd_preset_widget)
+        # USD Preset Widget 
+        self.usd_preset_slot = LazyWidget(USDPresetWidget, self._connect_preset_widget)
+        layout.addWidget(self.usd_preset_slot)
 
-        # Create LBP Preset Widget
-        self.lbp_preset_widget = LBPPresetWidget()
-        layout.addWidget(self.lbp_preset_widget)
+        # LBP Preset Widget
+        self.lbp_preset_slot = LazyWidget(LBPPresetWidget, self._connect_preset_widget)
+        layout.addWidget(self.lbp_preset_slot)
 
         # Create payment options container
         payment_container = QFrame()
@@ -266,20 +329,30 @@ class POSView(QWidget):
         payment_layout.setSpacing(10)
         
         # ADD USD widget
-        self.cash_usd_widget = CashUSDPaymentWidget()
-        payment_layout.addWidget(self.cash_usd_widget)
+        self.cash_usd_slot = LazyWidget(CashUSDPaymentWidget, self._connect_payment_widget)
+        payment_layout.addWidget(self.cash_usd_slot)
         
         # Add LBP widget
-        self.cash_lbp_widget = CashLBPPaymentWidget()
-        payment_layout.addWidget(self.cash_lbp_widget)
-
-        # Create and add card payment widget
-        self.card_payment_widget = CardPaymentWidget()
-        payment_layout.addWidget(self.card_payment_widget)
-        
-        # Create and add other payment widget
-        self.other_payment_widget = OtherPaymentWidget()
-        payment_layout.addWidget(self.other_payment_widget)
+        self.cash_lbp_slot = LazyWidget(CashLBPPaymentWidget, self._connect_payment_widget)
+        payment_layout.addWidget(self.cash_lbp_slot)
+
+        # Add card payment widget
+        self.card_payment_slot = LazyWidget(CardPaymentWidget, self._connect_payment_widget)
+        payment_layout.addWidget(self.card_payment_slot)
+        
+        # Add other payment widget
+        self.other_payment_slot = LazyWidget(OtherPaymentWidget, self._connect_payment_widget)
+        payment_layout.addWidget(self.other_payment_slot)
+
+        # Idle-time build order once the view has been painted
+        self._deferred_builds = [
+            slot.widget for slot in (
+                self.numpad_slot, self.usd_preset_slot, self.lbp_preset_slot,
+                self.cash_usd_slot, self.cash_lbp_slot,
+                self.card_payment_slot, self.other_payment_slot
+            )
+        ]
+        self._deferred_builds.append(lambda: self.keyboard)
         
         # Add payment container to main layout
         layout.addWidget(payment_container)
@@ -454,15 +527,21 @@ class POSView(QWidget):
         if search_text is None:
             search_text = self.search_input.text()
         
-        filtered_products = self.controller.get_filtered_products(search_text)
+        # The grid filters through the shared ProductService, which narrows
+        # the previous result set while the query is being extended
         self.product_grid.set_search_text(search_text)
 
-    def _on_product_selected(self, item_name):
+    def _on_product_selected(self, product_id):
         """Handle product button click"""
         # If this product is in protection period, ignore the click
-        if self.last_numpad_product == item_name and self.button_protection_timer.isActive():
+        if self.last_numpad_product == product_id and self.button_protection_timer.isActive():
             return
 
+        product = self.controller.get_product(product_id)
+        if product is None:
+            return
+        item_name = product.name
+
         try:
             # If has pending value from numpad
             if self.pending_value is not None:
@@ -473,27 +552,23 @@ class POSView(QWidget):
                     return
 
                 quantity = int(self.pending_value)
-                existing_item = self.controller.find_existing_item(item_name)
+                existing_item = self.controller.find_existing_item(product)
                 if existing_item:
-                    self._show_quantity_dialog(item_name, existing_item.quantity, quantity)
+                    self._show_quantity_dialog(existing_item, quantity)
                 else:
-                    success = self.controller.add_product_to_order(item_name, quantity)
+                    success = self.controller.add_product_to_order(product, quantity)
                     if not success:
                         self._show_validation_message(f"Failed to add {item_name}")
-                    else:
-                        self.refresh_order_display()
                 
                 # Start protection for this product button
-                self._protect_button(item_name)
+                self._protect_button(product_id)
                 
                 self.pending_value = None
             else:
                 # Regular click - add quantity of 1
-                success = self.controller.add_product_to_order(item_name)
+                success = self.controller.add_product_to_order(product)
                 if not success:
                     self._show_validation_message(f"Failed to add {item_name}")
-                else:
-                    self.refresh_order_display()
             
             self.search_input.clear_search()
             self.numpad_widget.clear()
@@ -504,46 +579,42 @@ class POSView(QWidget):
             self.numpad_widget.clear()
 
         # After successful processing, apply protection
-        # self._protect_button(item_name) # think about rapid clicks or not? protection was meant to be only after a numpad number selectton
+        # self._protect_button(product_id) # think about rapid clicks or not? protection was meant to be only after a numpad number selectton
 
     def refresh_order_display(self):
-        """Refresh the order list display from the controller data"""
-        # Get current order items from service through controller
-        order_summary = self.controller.get_order_summary()
-        
-        # First clear the current display 
-        # We need to directly manipulate the widget to ensure UI is cleared
-        self.order_list._clear_display()
-        self.order_list.order_items = []
-        
-        # Re-add each item to the OrderListWidget
-        for item_data in order_summary['items']:
-            # Create a new OrderItem with proper data
-            from models.order_item import OrderItem
-            from decimal import Decimal
-            
-            # Add to internal list first
-            item = OrderItem(
-                name=item_data['name'],
-                price=Decimal(str(item_data['price'])), 
-                quantity=item_data['quantity']
-            )
-            self.order_list.order_items.append(item)
+        """Rebuild the whole order list from the controller data
         
-        # Update the UI display
-        self.order_list._update_display()
-        # update totals
+        Regular changes arrive through _on_order_changed one line at a
+        time; this is only needed to resynchronise the display.
+        """
+        self.order_list.clear_lines()
+        for item in self.controller.get_order_items():
+            self.order_list.add_line(item)
         self._update_totals()
 
-    def _protect_button(self, item_name):
+    def _on_order_changed(self, event, item):
+        """Apply a single order change to the order list and totals"""
+        if event == OrderEvent.LINE_ADDED:
+            self.order_list.add_line(item)
+        elif event == OrderEvent.LINE_CHANGED:
+            self.order_list.update_line(item)
+        elif event == OrderEvent.LINE_REMOVED:
+            self.order_list.remove_line(item)
+        elif event == OrderEvent.CLEARED:
+            self.order_list.clear_lines()
+        self._update_totals()
+
+    def _protect_button(self, product_id):
         """Request button protection from product grid"""
-        self.last_numpad_product = item_name
-        self.product_grid.disable_button_temporarily(item_name)
+        if self.last_numpad_product not in (None, product_id):
+            self.product_grid.enable_button(self.last_numpad_product)
+        self.last_numpad_product = product_id
+        self.product_grid.disable_button_temporarily(product_id)
         self.button_protection_timer.start(self.BUTTON_PROTECTION_TIMEOUT_MS)
 
     def _reset_button_protection(self):
         """Request button protection removal"""
-        if self.last_numpad_product:
+        if self.last_numpad_product is not None:
             self.product_grid.enable_button(self.last_numpad_product)
         self.last_numpad_product = None
 
@@ -560,22 +631,22 @@ class POSView(QWidget):
         self.numpad_widget.clear()
         self.pending_value = None
 
-    def _add_product_with_quantity(self, item_name: str, quantity: int):
+    def _add_product_with_quantity(self, product, quantity: int):
         """Add new product with specified quantity"""
         # Use controller to add product
-        success = self.controller.add_product_to_order(item_name, quantity)
-        if success:
-            self.refresh_order_display()
+        self.controller.add_product_to_order(product, quantity)
             
         self.search_input.clear_search()
         self.numpad_widget.clear()
 
-    def _find_existing_item(self, item_name):
+    def _find_existing_item(self, product):
         """Find an existing item in the order list"""
-        return self.controller.find_existing_item(item_name)
+        return self.controller.find_existing_item(product)
     
-    def _show_quantity_dialog(self, item_name, current_qty, new_qty):
+    def _show_quantity_dialog(self, existing_item, new_qty):
         """Show dialog for quantity decision"""
+        item_name = existing_item.name
+        current_qty = existing_item.quantity
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle('Update Quantity')
         msg_box.setText(f"{item_name} exists with quantity {current_qty}")
@@ -606,23 +677,21 @@ class POSView(QWidget):
         
         if clicked_button == add_button:
             # Add new quantity to existing
-            self._update_item_quantity(item_name, current_qty + new_qty)
+            self._update_item_quantity(existing_item.line_key, current_qty + new_qty)
         elif clicked_button == replace_button:
             # Replace with new quantity
-            self._update_item_quantity(item_name, new_qty)
+            self._update_item_quantity(existing_item.line_key, new_qty)
         
         # Reset numpad regardless of choice (including cancel)
         self.numpad_widget.clear()
         self.pending_value = None
 
-    def _update_item_quantity(self, item_name: str, final_quantity: int):
+    def _update_item_quantity(self, line_key, final_quantity: int):
         """Update item quantity in order list"""
         try:
             # Update through controller
-            self.controller.update_item_quantity(item_name, final_quantity)
+            self.controller.update_item_quantity(line_key, final_quantity)
             
-            # Refresh the display
-            self.refresh_order_display()
             self.search_input.clear_search()
             self.numpad_widget.clear()
             
@@ -649,6 +718,9 @@ class POSView(QWidget):
         self.top_bar.search_changed.connect(self._on_search_changed)
         self.top_bar.lock_clicked.connect(self._on_lock_clicked)
 
+        # Order changes are applied to the order list one line at a time
+        self.controller.add_order_listener(self._on_order_changed)
+
         # OrderList connections
         self.order_list.order_cleared.connect(self._on_order_cleared)
         self.order_list.item_removed.connect(self._on_item_removed)
@@ -659,45 +731,44 @@ class POSView(QWidget):
         # Transaction buttons connections
         self.transaction_buttons.action_triggered.connect(self._on_transaction_action)
 
-        # Numpad connections
-        self.numpad_widget.value_changed.connect(self._on_numpad_value_changed)
-
         # Order type connections
         self.order_type_widget.order_type_changed.connect(self._on_order_type_changed)
 
-        # Payment widget connections
-        self.cash_usd_widget.payment_requested.connect(self._on_payment_action)
-        self.cash_lbp_widget.payment_requested.connect(self._on_payment_action)
-        self.card_payment_widget.payment_requested.connect(self._on_payment_action)
-        self.other_payment_widget.payment_requested.connect(self._on_payment_action)
+        # Numpad, preset and payment widgets are connected when they are
+        # built (see _connect_numpad, _connect_preset_widget and
+        # _connect_payment_widget)
 
-        # Preset widget connections
-        self.usd_preset_widget.preset_selected.connect(self._on_preset_selected)
-        self.lbp_preset_widget.preset_selected.connect(self._on_preset_selected)
+    def _connect_numpad(self, numpad_widget):
+        """Connect the numpad once it has been built"""
+        numpad_widget.value_changed.connect(self._on_numpad_value_changed)
 
         # Connect numpad clear method
-        original_clear = self.numpad_widget.clear
+        original_clear = numpad_widget.clear
         
         def wrapped_clear():
             original_clear()
             self._on_numpad_cleared()
             
-        self.numpad_widget.clear = wrapped_clear
+        numpad_widget.clear = wrapped_clear
+
+    def _connect_preset_widget(self, preset_widget):
+        """Connect a preset widget once it has been built"""
+        preset_widget.preset_selected.connect(self._on_preset_selected)
+
+    def _connect_payment_widget(self, payment_widget):
+        """Connect a payment widget once it has been built"""
+        payment_widget.payment_requested.connect(self._on_payment_action)
 
     # Event Handlers
     def _on_order_cleared(self):
         """Handle order being cleared"""
-        # Clear the order in the service layer
+        # Clear the order in the service layer; the display follows its event
         self.controller.clear_order()
-        # Update the UI
-        self._update_totals()
 
     def _on_item_removed(self, item):
         """Handle item removal from order"""
-        # Remove the item in the service layer
+        # Remove the item in the service layer; the display follows its event
         self.controller.remove_item_from_order(item)
-        # Update the UI
-        self._update_totals()
 
     def _on_order_type_changed(self, order_type):
         """Handle order type changes"""
@@ -705,11 +776,38 @@ class POSView(QWidget):
 
     def _update_totals(self):
         """Update totals display"""
-        total_usd = self.controller.get_order_total()
-        self.totals_widget.update_totals(total_usd)
+        totals = self.controller.get_order_totals()
+        self.totals_widget.update_totals(totals['total'])
+        self.order_list.update_quantity_summary(totals['item_count'], totals['line_count'])
 
     def _on_lock_clicked(self):
         """Handle lock button click"""
         from ..view_manager import ViewManager
+        # The view is kept by ViewManager while locked, so the open order
+        # and widget tree survive until the user unlocks
+        self.suspend()
         ViewManager.get_instance().switch_back_to_pin_view_from_pos(self.user_id)
-        self.deleteLater()
\ No newline at end of file
+
+    def suspend(self):
+        """Prepare the view to be hidden while the screen is locked"""
+        # Remaining idle-time builds resume when the view is shown again
+        self._deferred_build_timer.stop()
+        if self._keyboard is not None:
+            self._keyboard.hide()
+        if self.button_protection_timer.isActive():
+            self.button_protection_timer.stop()
+            self._reset_button_protection()
+
+    def dispose(self):
+        """Release links held by shared services before the view is deleted"""
+        self.suspend()
+        self.product_grid.detach()
+        KeyboardManager().unregister_input(self.search_input)
+
+    def resume(self):
+        """Prepare the view to be shown again after unlocking"""
+        # Another user's view may have taken over the shared keyboard manager
+        if self._keyboard is not None:
+            self._keyboard.manager.register_keyboard(self._keyboard)
+        else:
+            KeyboardManager().register_keyboard_factory(lambda: self.keyboard)
\ No newline at end of file
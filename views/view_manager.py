@@ -1,8 +1,11 @@
-from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout
-from PyQt5.QtCore import Qt
+from collections import OrderedDict
+from PyQt5.QtWidgets import QMainWindow
 
 class ViewManager:
     _instance = None
+
+    # Maximum number of POS views kept alive while locked
+    MAX_CACHED_POS_VIEWS = 4
     
     def __new__(cls):
         if cls._instance is None:
@@ -17,6 +20,11 @@ class ViewManager:
         self._initialized = True
         self.main_window = None
         self.auth_container = None
+        # POS views kept alive while locked, by user ID, so unlocking
+        # restores the same widgets and open order; least recently used first
+        self.pos_views = OrderedDict()
+        # Catalog shared by every POS view, created with the first one
+        self.product_service = None
     
     def initialize(self, main_window: QMainWindow):
         """Initialize with main window reference"""
@@ -37,58 +45,66 @@ class ViewManager:
     def switch_to_pos_view(self, user_id: str, user_name : str):
         """Switch to POS view"""
         if self.main_window:
-            # Hide the auth container
-            if self.auth_container:
-                self.auth_container.hide()
-            
-            # Import here to avoid circular import
-            from .pos.pos_view import POSView
-            
-            # Create and show POS view
-            pos_view = POSView(user_id, user_name, self.main_window)
-            self.main_window.setCentralWidget(pos_view)
-            pos_view.show()
+            pos_view = self.pos_views.get(user_id)
+            if pos_view is None:
+                # Import here to avoid circular import
+                from .pos.pos_view import POSView
+                from controllers.pos_controller import POSController
+                from services.product_service import ProductService
+
+                if self.product_service is None:
+                    self.product_service = ProductService()
+
+                # Create the user's POS view on first unlock
+                pos_view = POSView(
+                    user_id, user_name, self.main_window,
+                    controller=POSController(self.product_service)
+                )
+                self.main_window.central_stack.addWidget(pos_view)
+                self.pos_views[user_id] = pos_view
+            else:
+                self.pos_views.move_to_end(user_id)
+                pos_view.resume()
+
+            self.main_window.central_stack.setCurrentWidget(pos_view)
+            self._evict_pos_views()
     
     def switch_back_to_pin_view_from_pos(self, user_name: str):
         """Switch from POS view back to PIN view"""
         if self.main_window:
-            # Create central widget to hold everything
-            central_widget = QWidget()
-            self.main_window.setCentralWidget(central_widget)
-            main_layout = QVBoxLayout(central_widget)
-            main_layout.setContentsMargins(20, 20, 20, 20)
-            
-            # Add top bar
-            from components.auth import AuthTopBar
-            auth_top_bar = AuthTopBar(central_widget)
-            main_layout.addWidget(auth_top_bar)
-            
-            main_layout.addStretch()
-            
-            # Center container horizontally with auth container
-            center_layout = QHBoxLayout()
-            center_layout.addStretch()
-            
-            # Import here to avoid circular import
-            from components.auth import AuthenticationContainer
-            
-            self.auth_container = AuthenticationContainer()
-            self.auth_container.setFocusPolicy(Qt.StrongFocus)
+            # The POS view stays in the stack, hidden, until the next unlock
+            self.main_window.central_stack.setCurrentWidget(self.main_window.auth_page)
+
+            # The auth widgets are reused; only their input state is reset
             self.auth_container.switch_to_pin_view(user_name)
-            center_layout.addWidget(self.auth_container)
-            
-            center_layout.addStretch()
-            main_layout.addLayout(center_layout)
-            main_layout.addStretch()
-            
-            # Set focus
             self.auth_container.setFocus()
-            if hasattr(self.auth_container, 'pin_view'):
-                self.auth_container.pin_view.setFocus()
+            self.auth_container.pin_view.setFocus()
+
+    def _evict_pos_views(self):
+        """Discard cached POS views beyond the cache bound
+
+        Views without an open order go first, least recently used first;
+        the current view is never evicted.
+        """
+        while len(self.pos_views) > self.MAX_CACHED_POS_VIEWS:
+            candidates = list(self.pos_views)[:-1]
+            idle = [
+                user_id for user_id in candidates
+                if not self.pos_views[user_id].controller.get_order_items()
+            ]
+            self.discard_pos_view((idle or candidates)[0])
+
+    def discard_pos_view(self, user_id: str):
+        """Delete a user's cached POS view"""
+        pos_view = self.pos_views.pop(user_id, None)
+        if pos_view is not None:
+            pos_view.dispose()
+            self.main_window.central_stack.removeWidget(pos_view)
+            pos_view.deleteLater()
     
     @classmethod
     def get_instance(cls):
         """Get singleton instance"""
         if cls._instance is None:
             cls._instance = ViewManager()
-        return cls._instance
\ No newline at end of file
+        return cls._instance